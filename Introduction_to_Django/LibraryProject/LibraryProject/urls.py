@@ -23,7 +23,9 @@ urlpatterns = [
 
 from django.contrib import admin
 from django.urls import path
+from shared.perf import perf_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('__perf__', perf_view, name='perf'),
 ]
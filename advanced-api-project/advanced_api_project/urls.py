@@ -16,6 +16,7 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from shared.perf import perf_view
 from rest_framework.routers import DefaultRouter
 from api.views import AuthorViewSet, BookViewSet
 
@@ -25,6 +26,7 @@ router.register(r"books", BookViewSet)
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("__perf__", perf_view, name="perf"),
     path("api/", include(router.urls)),
     path("api/", include("api.urls")),
 ]
@@ -0,0 +1,170 @@
+# api/bulk.py
+"""
+Validation and writes for the bulk book endpoint (BookBulkView).
+
+A whole batch is validated in one pass before anything is written:
+every item goes through BookSerializer (many=True, partial for
+updates), with the authors of the batch looked up by one in_bulk()
+instead of one query per item (and the books being updated with
+another), and each item's errors are reported under its index. Valid
+batches are then written in BULK_CHUNK_SIZE chunks (bulk_create for
+inserts, bulk_update per set of changed fields, delete() per chunk of
+ids) inside one transaction, so a batch is applied completely or not
+at all.
+
+The response cache versions are bumped once per batch rather than once
+per row (see api/cache.py and one_version_bump() in api/signals.py).
+"""
+from django.db import transaction
+from rest_framework import serializers
+
+from .models import Author, Book
+from .serializers import BookSerializer
+from .signals import one_version_bump
+
+BULK_CHUNK_SIZE = 1000
+
+REQUIRED = "This field is required."
+NOT_AN_INTEGER = "A valid integer is required."
+UNKNOWN_BOOK = "No book with this id."
+
+
+class BulkValidationError(Exception):
+    def __init__(self, errors):
+        super().__init__(errors)
+        # [{"index": i, "errors": {field: [message, ...]}}, ...]
+        self.errors = errors
+
+
+def as_int(value):
+    # bools are ints in Python but not valid ids or years
+    if isinstance(value, bool):
+        raise ValueError(value)
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    raise ValueError(value)
+
+
+class BatchAuthorField(serializers.PrimaryKeyRelatedField):
+    """Resolves ids from the context's {id: author} instead of a query each."""
+
+    def to_internal_value(self, data):
+        try:
+            pk = as_int(data)
+        except ValueError:
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        author = self.context["authors"].get(pk)
+        if author is None:
+            self.fail("does_not_exist", pk_value=data)
+        return author
+
+
+class BulkBookSerializer(BookSerializer):
+    author = BatchAuthorField(queryset=Author.objects.all())
+
+
+def validate_books(items, partial=False):
+    """
+    Validate create (partial=False) or update (partial=True) items.
+    Updates must carry the `id` of an existing book. Returns a list of
+    cleaned dicts (author resolved to its id) or raises BulkValidationError.
+    """
+    author_ids, ids = set(), []
+    for item in items:
+        item = item if isinstance(item, dict) else {}
+        try:
+            author_ids.add(as_int(item.get("author")))
+        except ValueError:
+            pass  # reported by the serializer
+        try:
+            ids.append(as_int(item.get("id")))
+        except ValueError:
+            ids.append(None)
+
+    serializer = BulkBookSerializer(
+        data=items, many=True, partial=partial,
+        context={"authors": Author.objects.in_bulk(author_ids) if author_ids else {}},
+    )
+    item_errors = [{} for _ in items]
+    if not serializer.is_valid():
+        # {index: errors} of the invalid items; older DRFs give a list per item
+        errors = serializer.errors
+        for index, errors in (errors.items() if isinstance(errors, dict) else enumerate(errors)):
+            item_errors[index] = dict(errors)
+    if partial:
+        known = {pk for pk in ids if pk is not None}
+        known_books = set(Book.objects.in_bulk(known)) if known else set()
+        for item, pk, errors in zip(items, ids, item_errors):
+            if not isinstance(item, dict):
+                continue
+            if pk is None:
+                errors["id"] = [REQUIRED if "id" not in item else NOT_AN_INTEGER]
+            elif pk not in known_books:
+                errors["id"] = [UNKNOWN_BOOK]
+
+    errors = [{"index": index, "errors": e} for index, e in enumerate(item_errors) if e]
+    if errors:
+        raise BulkValidationError(errors)
+    cleaned_items = []
+    for pk, data in zip(ids, serializer.validated_data):
+        cleaned = dict(data)
+        if "author" in cleaned:
+            cleaned["author"] = cleaned["author"].pk
+        if partial:
+            cleaned["id"] = pk
+        cleaned_items.append(cleaned)
+    return cleaned_items
+
+
+def book_from(cleaned):
+    fields = dict(cleaned)
+    if "author" in fields:
+        fields["author_id"] = fields.pop("author")
+    return Book(**fields)
+
+
+def create_books(items):
+    """Validate and insert; returns the new books (with ids where the DB reports them)."""
+    cleaned_items = validate_books(items)
+    with transaction.atomic(), one_version_bump(Book._meta.db_table):
+        books = Book.objects.bulk_create(
+            [book_from(cleaned) for cleaned in cleaned_items], batch_size=BULK_CHUNK_SIZE)
+    return books
+
+
+def update_books(items):
+    """Validate and apply partial updates; returns the number of books updated."""
+    cleaned_items = validate_books(items, partial=True)
+    # bulk_update() writes one set of fields, so items are grouped by the
+    # fields they change; unchanged columns are left alone
+    groups = {}
+    for cleaned in cleaned_items:
+        fields = tuple(sorted(name for name in cleaned if name != "id"))
+        if fields:
+            groups.setdefault(fields, []).append(book_from(cleaned))
+    with transaction.atomic(), one_version_bump(Book._meta.db_table):
+        for fields, books in groups.items():
+            Book.objects.bulk_update(books, fields, batch_size=BULK_CHUNK_SIZE)
+    return sum(len(books) for books in groups.values())
+
+
+def delete_books(ids):
+    """Delete books by id in chunks; returns the number deleted."""
+    errors = []
+    cleaned_ids = []
+    for index, value in enumerate(ids):
+        try:
+            cleaned_ids.append(as_int(value))
+        except ValueError:
+            errors.append({"index": index, "errors": {"id": [NOT_AN_INTEGER]}})
+    if errors:
+        raise BulkValidationError(errors)
+    deleted = 0
+    with transaction.atomic(), one_version_bump(Book._meta.db_table):
+        for start in range(0, len(cleaned_ids), BULK_CHUNK_SIZE):
+            chunk = cleaned_ids[start:start + BULK_CHUNK_SIZE]
+            _, per_model = Book.objects.filter(pk__in=chunk).delete()
+            deleted += per_model.get(Book._meta.label, 0)
+    return deleted
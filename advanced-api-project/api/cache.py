@@ -0,0 +1,146 @@
+"""
+Response caching and conditional GET for the read-only API views.
+
+Every table a cached view reads has a version number in the cache. It
+is seeded with the current time in nanoseconds and replaced with a new
+timestamp when a transaction that saved or deleted a Book or Author
+commits (see api/signals.py). A cached response is stored under its
+normalized query string plus the current versions, so a write makes
+every older entry unreachable instead of having to find and delete it.
+The versions also give us a strong ETag and a Last-Modified date for
+free. The ETag is the validator to rely on: Last-Modified only has
+one-second resolution, so it is left out while its second is current.
+
+Queryset.update()/bulk_create() send no signals; code that uses them
+must call bump_table_versions() itself, from transaction.on_commit().
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.utils.http import http_date, parse_etags, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+from shared.drf.projection import EXCLUDE_PARAM, FIELDS_PARAM, parse_field_list
+
+RESPONSE_TIMEOUT = 300
+
+
+def api_cache():
+    return caches[getattr(settings, "API_CACHE", "default")]
+
+
+def version_key(table):
+    return f"api:version:{table}"
+
+
+def table_versions(*tables):
+    """Current version (a time in ns) of each table, seeding missing ones."""
+    cache = api_cache()
+    keys = [version_key(table) for table in tables]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns(), None)
+            found[key] = cache.get(key)
+        versions.append(found[key])
+    return versions
+
+
+def bump_table_versions(*tables):
+    now = time.time_ns()
+    api_cache().set_many({version_key(table): now for table in tables}, None)
+
+
+# Query parameters whose value is compared case-insensitively
+CASE_INSENSITIVE_PARAMS = {"q", "search"}
+# Query parameters holding an unordered, comma-separated list of names
+FIELD_LIST_PARAMS = {FIELDS_PARAM, EXCLUDE_PARAM}
+
+
+def normalize_value(name, value):
+    value = value.strip()
+    if name in CASE_INSENSITIVE_PARAMS:
+        return value.lower()
+    if name in FIELD_LIST_PARAMS:
+        return ",".join(parse_field_list(value))
+    return value
+
+
+def normalize_query_params(query_params, defaults=None):
+    """
+    Canonical, hashable form of a query string: keys sorted, blank values
+    dropped, surrounding whitespace stripped, case-insensitive params
+    lowercased, field lists sorted and params equal to the view's default
+    left out.
+    """
+    defaults = defaults or {}
+    items = []
+    for name in sorted(query_params):
+        values = sorted(normalize_value(name, v) for v in query_params.getlist(name))
+        values = [v for v in values if v]
+        if values and values != [defaults.get(name)]:
+            items.append((name, tuple(values)))
+    return tuple(items)
+
+
+class CachedListMixin:
+    """
+    Caches list() responses and answers conditional GETs with 304.
+
+    Set `cache_tables` to every table the response depends on, and
+    `cache_param_defaults` to query params whose default value should
+    share a key with leaving the param out (e.g. {"ordering": "title"}).
+    """
+
+    cache_tables = ()
+    cache_param_defaults = {}
+    cache_timeout = RESPONSE_TIMEOUT
+
+    def list(self, request, *args, **kwargs):
+        versions = table_versions(*self.cache_tables)
+        params = normalize_query_params(request.query_params, self.cache_param_defaults)
+        # Pagination links are absolute URLs, so scheme and host are part
+        # of the cached data
+        fingerprint = repr((
+            type(self).__name__, request.scheme, request.get_host(),
+            request.accepted_renderer.format, params, versions,
+        ))
+        digest = hashlib.sha1(fingerprint.encode()).hexdigest()
+        etag = f'"{digest}"'
+        last_modified = max(versions) // 1_000_000_000 if versions else None
+        if last_modified is not None and last_modified >= int(time.time()):
+            # A later write in this same second would not change it
+            last_modified = None
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if last_modified is not None:
+            headers["Last-Modified"] = http_date(last_modified)
+
+        if self.not_modified(request, etag, last_modified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        cache = api_cache()
+        key = f"api:response:{digest}"
+        data = cache.get(key)
+        if data is None:
+            response = super().list(request, *args, **kwargs)
+            if response.status_code != status.HTTP_200_OK:
+                return response
+            cache.set(key, response.data, self.cache_timeout)
+        else:
+            response = Response(data)
+        for name, value in headers.items():
+            response[name] = value
+        return response
+
+    @staticmethod
+    def not_modified(request, etag, last_modified):
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match:
+            # If-None-Match wins over If-Modified-Since (RFC 9110 13.1.3)
+            return if_none_match.strip() == "*" or etag in parse_etags(if_none_match)
+        since = parse_http_date_safe(request.headers.get("If-Modified-Since", ""))
+        return since is not None and last_modified is not None and last_modified <= since
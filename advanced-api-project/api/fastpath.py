@@ -0,0 +1,128 @@
+# api/fastpath.py
+"""
+Read-only fast path for ModelSerializer output.
+
+A ValuesPlan is compiled once per serializer class from its fields: the
+columns to SELECT with QuerySet.values() and, per field, the output key
+and an optional converter. Rows then go straight from the database
+cursor to output dicts, skipping model instantiation and DRF's per-field
+attribute lookups. The output is the same, key for key and type for
+type, as serializer.data (see api/test_fastpath.py and the
+bench_serializers command).
+
+Only plain model fields and primary-key related fields are supported;
+values_plan() returns None for anything else (nested serializers,
+method fields) and callers fall back to the regular serializer. That
+includes AuthorSerializer, whose capped nested books are built by
+SerializerMethodFields: AuthorViewSet lists through DRF.
+"""
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import ForeignKey
+from rest_framework import serializers
+from rest_framework.response import Response
+
+from shared.drf.projection import ordering_columns
+
+# Fields whose to_representation() is a no-op for values coming from the DB
+PASSTHROUGH_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.FloatField,
+)
+
+
+class ValuesPlan:
+    def __init__(self, model, fields):
+        self.model = model
+        # (output key, column, converter or None), in serializer field order
+        self.fields = fields
+        self.columns = tuple(dict.fromkeys(column for _, column, _ in fields))
+
+    def values(self, queryset, extra=()):
+        """
+        values() of the plan's columns plus `extra` ones (e.g. the ordering
+        columns a cursor paginator reads back); represent() leaves the
+        extra ones out of the output.
+        """
+        # Prefetches are instance-based and nothing here reads them
+        columns = dict.fromkeys(self.columns + tuple(extra))
+        return queryset.prefetch_related(None).values(*columns)
+
+    def represent(self, rows):
+        """Turn values() dicts into output dicts."""
+        data = []
+        for row in rows:
+            item = {}
+            for key, column, convert in self.fields:
+                value = row[column]
+                item[key] = value if convert is None or value is None else convert(value)
+            data.append(item)
+        return data
+
+
+@lru_cache(maxsize=256)
+def values_plan(serializer_class, fields=None, exclude=()):
+    """
+    Compile a ValuesPlan for `serializer_class`, or None if unsupported.
+    `fields`/`exclude` (tuples) select a projection of a serializer using
+    shared.drf.projection.DynamicFieldsMixin; ProjectionMixin.get_projection()
+    has rejected unknown names before they get here.
+    """
+    if fields is None and not exclude:
+        serializer = serializer_class()
+    else:
+        serializer = serializer_class(fields=fields, exclude=exclude)
+    model = serializer.Meta.model
+    fields = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.BaseSerializer):
+            return None
+        if "." in field.source or field.source == "*":
+            return None
+        try:
+            model_field = model._meta.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        if isinstance(field, serializers.PrimaryKeyRelatedField):
+            if not isinstance(model_field, ForeignKey) or field.pk_field is not None:
+                return None
+            fields.append((name, model_field.attname, None))
+        elif isinstance(field, PASSTHROUGH_FIELDS) and type(field).to_representation in {
+            cls.to_representation for cls in PASSTHROUGH_FIELDS
+        }:
+            fields.append((name, model_field.attname, None))
+        elif isinstance(field, (serializers.ModelField, serializers.RelatedField,
+                                serializers.SerializerMethodField)):
+            return None
+        else:
+            fields.append((name, model_field.attname, field.to_representation))
+    return ValuesPlan(model, fields)
+
+
+class FastListMixin:
+    """
+    list() through values_plan() when the serializer supports it.
+    Works with the configured paginator, which sees plain values() dicts,
+    and with ProjectionMixin, whose projection selects the plan's columns.
+    """
+
+    def list(self, request, *args, **kwargs):
+        projection = self.get_projection() if hasattr(self, "get_projection") else ()
+        plan = values_plan(self.get_serializer_class(), *projection)
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        # The paginator orders by these (id as the tie-breaker) and reads
+        # them back from the last row of the page
+        ordering = [*ordering_columns(queryset), queryset.model._meta.pk.name]
+        queryset = plan.values(queryset, ordering)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(plan.represent(page))
+        return Response(plan.represent(queryset))
+
@@ -0,0 +1,186 @@
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+import django
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.test.utils import (
+    CaptureQueriesContext, setup_test_environment, teardown_test_environment,
+)
+
+from api.cache import api_cache
+from api.models import Author, Book
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_SIZES = "10000,100000,1000000"
+
+
+def percentile(sorted_values, pct):
+    index = max(0, int(round(pct / 100 * len(sorted_values))) - 1)
+    return sorted_values[index]
+
+
+def peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return peak // 1024 if platform.system() == "Darwin" else peak
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the Book API: seed a throwaway SQLite database with "
+        "authors/books at each --sizes row count, drive the list and detail "
+        "endpoints through the test client and write p50/p99 latency, "
+        "throughput, queries per request and peak RSS to a JSON file."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                            help=f"Comma-separated book counts (default {DEFAULT_SIZES}).")
+        parser.add_argument("--requests", type=int, default=200,
+                            help="Requests per endpoint and size.")
+        parser.add_argument("--books-per-author", type=int, default=10)
+        parser.add_argument("--output", default="bench_api.json",
+                            help="JSON file to write the results to.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted(int(size) for size in options["sizes"].split(","))
+        except ValueError:
+            raise CommandError("--sizes must be comma-separated integers.")
+        if connection.vendor != "sqlite":
+            raise CommandError("bench_api seeds a throwaway SQLite database.")
+        self.random = random.Random(options["seed"])
+        self.per_author = options["books_per_author"]
+
+        report = {
+            "commit": git_commit(),
+            "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "requests_per_endpoint": options["requests"],
+            "sizes": {},
+        }
+        with self.test_database():
+            for size in sizes:
+                self.seed(size)
+                report["sizes"][str(size)] = self.bench_size(size, options["requests"])
+
+        with open(options["output"], "w") as f:
+            json.dump(report, f, indent=2)
+            f.write("\n")
+        self.stdout.write(f"Wrote {options['output']}")
+
+    @contextmanager
+    def test_database(self):
+        # A file rather than the default in-memory test database, so peak
+        # RSS measures the API and not the dataset
+        tmpdir = tempfile.mkdtemp(prefix="bench_api-")
+        test_settings = connection.settings_dict["TEST"]
+        old_test_name = test_settings["NAME"]
+        test_settings["NAME"] = os.path.join(tmpdir, "bench.sqlite3")
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        try:
+            yield
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+            test_settings["NAME"] = old_test_name
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def seed(self, size):
+        """Top the tables up to `size` books (sizes are seeded in ascending order)."""
+        start = time.perf_counter()
+        have = Book.objects.count()
+        authors_needed = max(1, size // self.per_author)
+        first_author = Author.objects.count()
+        Author.objects.bulk_create(
+            (Author(name=f"Bench author {i}") for i in range(first_author, authors_needed)),
+            batch_size=1000,
+        )
+        author_ids = list(Author.objects.order_by("id").values_list("id", flat=True))
+        Book.objects.bulk_create(
+            (
+                Book(title=f"Bench book {i}", publication_year=1900 + i % 120,
+                     author_id=author_ids[i % len(author_ids)])
+                for i in range(have, size)
+            ),
+            batch_size=1000,
+        )
+        self.stderr.write(f"seeded {size} books in {time.perf_counter() - start:.1f}s")
+
+    def cases(self):
+        book_ids = list(Book.objects.values_list("id", flat=True)[:10000])
+        author_ids = list(Author.objects.values_list("id", flat=True)[:10000])
+        pick = self.random.choice
+        # /api/books/ and /api/books/<pk>/ are both served by BookViewSet,
+        # so each view is benchmarked once
+        return {
+            # Distinct filters per request, so the response cache misses
+            "book-list": lambda i: ("/api/books/", {
+                "author": pick(author_ids), "page_size": 50 + i % 50}),
+            "book-list-search": lambda i: ("/api/books/", {
+                "search": f"book {pick(book_ids)}", "ordering": "id"}),
+            "book-list-cached": lambda i: ("/api/books/", {}),
+            "book-detail": lambda i: (f"/api/books/{pick(book_ids)}/", {}),
+            "author-list": lambda i: ("/api/authors/", {"page_size": 10 + i % 40}),
+        }
+
+    def bench_size(self, size, requests):
+        api_cache().clear()
+        client = Client()
+        results = {}
+        for name, make_request in self.cases().items():
+            timings, queries = [], []
+            for i in range(requests):
+                path, params = make_request(i)
+                with CaptureQueriesContext(connection) as ctx:
+                    start = time.perf_counter()
+                    response = client.get(path, params)
+                    elapsed = time.perf_counter() - start
+                if response.status_code != 200:
+                    raise CommandError(f"GET {path} {params} returned {response.status_code}")
+                timings.append(elapsed)
+                queries.append(len(ctx.captured_queries))
+            timings.sort()
+            results[name] = {
+                "p50_ms": round(percentile(timings, 50) * 1000, 3),
+                "p99_ms": round(percentile(timings, 99) * 1000, 3),
+                "throughput_rps": round(len(timings) / sum(timings), 1),
+                "queries_mean": round(sum(queries) / len(queries), 2),
+                "queries_max": max(queries),
+            }
+            self.stdout.write(
+                f"{size:>8} {name:<20} p50 {results[name]['p50_ms']:>8.2f} ms  "
+                f"p99 {results[name]['p99_ms']:>8.2f} ms  "
+                f"{results[name]['throughput_rps']:>8.1f} req/s  "
+                f"{results[name]['queries_mean']:>5.1f} queries"
+            )
+        results["peak_rss_kb"] = peak_rss_kb()
+        return results
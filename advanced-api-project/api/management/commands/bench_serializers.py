@@ -0,0 +1,71 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from api.fastpath import values_plan
+from api.models import Author, Book
+from api.serializers import BookSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF serialization of books with the values() fast path on "
+        "throwaway rows (rolled back afterwards) and report rows/sec. Authors "
+        "are not benchmarked: their capped nested books always go through DRF."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=5000, help="Books to create.")
+        parser.add_argument("--books-per-author", type=int, default=10)
+        parser.add_argument("--repeat", type=int, default=3, help="Best of N runs.")
+
+    def handle(self, *args, **options):
+        rows, repeat = options["rows"], options["repeat"]
+        with transaction.atomic():
+            self.seed(rows, options["books_per_author"])
+            self.bench("books", BookSerializer, Book.objects.all(), repeat)
+            transaction.set_rollback(True)
+
+    def seed(self, rows, per_author):
+        authors = Author.objects.bulk_create(
+            Author(name=f"Bench author {i}") for i in range(max(1, rows // per_author))
+        )
+        Book.objects.bulk_create(
+            (
+                Book(title=f"Bench book {i}", publication_year=1900 + i % 120,
+                     author=authors[i % len(authors)])
+                for i in range(rows)
+            ),
+            batch_size=1000,
+        )
+
+    def bench(self, label, serializer_class, queryset, repeat):
+        renderer = JSONRenderer()
+        plan = values_plan(serializer_class)
+
+        def slow():
+            return renderer.render(serializer_class(queryset.all(), many=True).data)
+
+        def fast():
+            return renderer.render(plan.represent(plan.values(queryset.all())))
+
+        if slow() != fast():
+            raise CommandError(f"{label}: fast path output differs from the serializer")
+        count = queryset.count()
+        slow_rate = count / self.best_of(slow, repeat)
+        fast_rate = count / self.best_of(fast, repeat)
+        self.stdout.write(
+            f"{label:<8} {count:>8} rows  serializer {slow_rate:>10,.0f} rows/s  "
+            f"fast path {fast_rate:>10,.0f} rows/s  ({fast_rate / slow_rate:.1f}x)"
+        )
+
+    @staticmethod
+    def best_of(func, repeat):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
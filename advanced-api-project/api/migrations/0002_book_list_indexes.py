@@ -0,0 +1,52 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:28
+
+from django.db import migrations, models
+
+# icontains compiles to UPPER(col) LIKE UPPER(%s) on PostgreSQL, which a
+# trigram GIN index on UPPER(col) can serve. Other backends have no
+# equivalent, so this only runs on PostgreSQL.
+TRIGRAM_INDEXES = [
+    ("book_title_trgm_idx", "api_book", "title"),
+    ("author_name_trgm_idx", "api_author", "name"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" '
+            f'USING gin (UPPER("{column}"::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['author', 'publication_year'], name='book_author_year_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['title', 'id'], name='book_title_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='book',
+            index=models.Index(fields=['publication_year', 'id'], name='book_year_idx'),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
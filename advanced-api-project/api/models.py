@@ -7,6 +7,9 @@ class Author(models.Model):
     # Human-readable name of the author.
     name = models.CharField(max_length=255)
 
+    # The author__name substring search cannot use a b-tree index; it gets
+    # a trigram index on PostgreSQL (api/migrations/0002)
+
     def __str__(self) -> str:
         return self.name
 
@@ -27,5 +30,16 @@ class Book(models.Model):
         related_name="books",
     )
 
+    class Meta:
+        # Access paths of the book list: ?author= (optionally with ?year= or
+        # ordered by year) and the cursor orderings title/year, each with
+        # the id tie-breaker. Substring search gets trigram indexes on
+        # PostgreSQL, see migration 0002.
+        indexes = [
+            models.Index(fields=["author", "publication_year"], name="book_author_year_idx"),
+            models.Index(fields=["title", "id"], name="book_title_idx"),
+            models.Index(fields=["publication_year", "id"], name="book_year_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.title} ({self.publication_year})"
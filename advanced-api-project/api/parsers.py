@@ -0,0 +1,29 @@
+# api/parsers.py
+import codecs
+import json
+
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+
+
+class NDJSONParser(BaseParser):
+    """
+    Newline-delimited JSON: one value per line, blank lines ignored.
+    Parses to a list, so views see the same data as for a JSON array.
+    """
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        reader = codecs.getreader(encoding)(stream)
+        items = []
+        for lineno, line in enumerate(reader, start=1):
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError as exc:
+                raise ParseError(f"NDJSON parse error on line {lineno}: {exc}")
+        return items
@@ -1,11 +1,14 @@
 from datetime import date
+from django.urls import reverse
 from rest_framework import serializers
 from .models import Author, Book
+from shared.drf.projection import DynamicFieldsMixin
 
 # BookSerializer: serializes all fields and validates publication_year.
+# Both serializers accept fields=/exclude= (see shared/drf/projection.py).
 
 
-class BookSerializer(serializers.ModelSerializer):
+class BookSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Book
         fields = ["id", "title", "publication_year", "author"]
@@ -23,11 +26,59 @@ class BookSerializer(serializers.ModelSerializer):
         return value
 
 
+# At most this many books are nested per author (see AuthorViewSet)
+NESTED_BOOKS_LIMIT = 10
+
+
+def books_mode(request):
+    """Value of ?books= ("count" drops the nested books), if any."""
+    return request.query_params.get("books") if request is not None else None
+
+
 # AuthorSerializer: includes nested list of the author's books.
 # Uses the reverse FK via related_name="books".
-class AuthorSerializer(serializers.ModelSerializer):
-    books = BookSerializer(many=True, read_only=True)  # nested representation
+class AuthorSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    # nested representation, capped at NESTED_BOOKS_LIMIT books; the
+    # count and a link to the rest are only added when it was capped
+    books = serializers.SerializerMethodField()
+    books_count = serializers.SerializerMethodField()
+    books_more = serializers.SerializerMethodField()
 
     class Meta:
         model = Author
-        fields = ["id", "name", "books"]
+        fields = ["id", "name", "books", "books_count", "books_more"]
+
+    def get_fields(self):
+        fields = super().get_fields()
+        # ?books=count: counts only, no nested books
+        if books_mode(self.context.get("request")) == "count":
+            del fields["books"]
+        return fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Authors whose books all fit keep the plain {id, name, books} shape
+        if "books" in data and data.get("books_more", "") is None:
+            del data["books_more"]
+            data.pop("books_count", None)
+        return data
+
+    def get_books(self, obj):
+        # AuthorViewSet prefetches the first books into `top_books`
+        books = getattr(obj, "top_books", None)
+        if books is None:
+            books = obj.books.order_by("id")[:NESTED_BOOKS_LIMIT]
+        return BookSerializer(books, many=True, context=self.context).data
+
+    def get_books_count(self, obj) -> int:
+        # Annotated by AuthorViewSet; counted on demand elsewhere
+        count = getattr(obj, "books_count", None)
+        return obj.books.count() if count is None else count
+
+    def get_books_more(self, obj):
+        """Link to the full, paginated book list when `books` was capped."""
+        if self.get_books_count(obj) <= NESTED_BOOKS_LIMIT:
+            return None
+        url = f"{reverse('book-list')}?author={obj.pk}"
+        request = self.context.get("request")
+        return request.build_absolute_uri(url) if request else url
@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+from threading import local
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import bump_table_versions
+from .models import Author, Book
+
+_bulk = local()
+
+
+@contextmanager
+def one_version_bump(*tables):
+    """
+    For bulk writes: model signals sent inside the block bump nothing, and
+    `tables` are bumped once when the transaction commits instead of once
+    per row. Use inside transaction.atomic().
+    """
+    outer, _bulk.active = getattr(_bulk, "active", False), True
+    try:
+        yield
+    finally:
+        _bulk.active = outer
+    transaction.on_commit(lambda: bump_table_versions(*tables))
+
+
+@receiver(post_save, sender=Book)
+@receiver(post_delete, sender=Book)
+@receiver(post_save, sender=Author)
+@receiver(post_delete, sender=Author)
+def bump_api_cache_version(sender, **kwargs):
+    if getattr(_bulk, "active", False):
+        return
+    # Only once the write is visible: bumping inside the transaction would
+    # let a concurrent request cache the old rows under the new version
+    table = sender._meta.db_table
+    transaction.on_commit(lambda: bump_table_versions(table))
@@ -0,0 +1,51 @@
+# api/test_authors.py
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .models import Author, Book
+from .serializers import NESTED_BOOKS_LIMIT
+
+
+class AuthorNestedBooksTests(APITestCase):
+    def setUp(self):
+        self.prolific = Author.objects.create(name="Prolific")
+        self.other = Author.objects.create(name="Other")
+        Book.objects.bulk_create(
+            Book(title=f"Book {i}", publication_year=1900 + i, author=self.prolific)
+            for i in range(NESTED_BOOKS_LIMIT + 5)
+        )
+        Book.objects.create(title="Only one", publication_year=2000, author=self.other)
+        self.url = reverse("author-list")
+
+    def test_books_are_capped_with_more_link(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(self.url)
+        self.assertEqual(len(ctx.captured_queries), 2)
+        prolific, other = response.data["results"]
+
+        self.assertEqual(len(prolific["books"]), NESTED_BOOKS_LIMIT)
+        self.assertEqual(prolific["books_count"], NESTED_BOOKS_LIMIT + 5)
+        self.assertTrue(prolific["books_more"].endswith(f"/api/books/?author={self.prolific.pk}"))
+        # Untruncated authors keep the original payload
+        self.assertEqual(set(other), {"id", "name", "books"})
+        self.assertEqual(len(other["books"]), 1)
+
+    def test_count_only_mode(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"books": "count"})
+        prolific = response.data["results"][0]
+        self.assertNotIn("books", prolific)
+        self.assertEqual(prolific["books_count"], NESTED_BOOKS_LIMIT + 5)
+
+    def test_more_link_lists_the_rest(self):
+        more = self.client.get(self.url).data["results"][0]["books_more"]
+        response = self.client.get(f"{more}&page_size=100")
+        self.assertEqual(len(response.data["results"]), NESTED_BOOKS_LIMIT + 5)
+
+    def test_ordering_by_name(self):
+        response = self.client.get(self.url, {"ordering": "name", "page_size": 1})
+        self.assertEqual(response.data["results"][0]["name"], "Other")
+        response = self.client.get(response.data["next"])
+        self.assertEqual(response.data["results"][0]["name"], "Prolific")
@@ -0,0 +1,96 @@
+# api/test_bulk.py
+import json
+from datetime import date
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import Author, Book
+
+
+class BookBulkTests(APITestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username="tester", password="pass1234")
+        self.client.force_authenticate(self.user)
+        self.achebe = Author.objects.create(name="Chinua Achebe")
+        self.adichie = Author.objects.create(name="Chimamanda Ngozi Adichie")
+        self.url = reverse("book-bulk")
+
+    def test_create_from_json_array(self):
+        payload = [
+            {"title": f"Book {i}", "publication_year": 1950 + i, "author": self.achebe.id}
+            for i in range(30)
+        ]
+        with self.assertNumQueries(4):  # savepoint, author lookup, insert, release
+            response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 30)
+        self.assertEqual(Book.objects.filter(author=self.achebe).count(), 30)
+
+    def test_create_from_ndjson(self):
+        body = "\n".join(json.dumps(
+            {"title": t, "publication_year": 2006, "author": self.adichie.id}
+        ) for t in ["Purple Hibiscus", "Half of a Yellow Sun"]) + "\n"
+        response = self.client.post(self.url, body, content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Book.objects.count(), 2)
+
+    def test_invalid_items_reported_and_nothing_written(self):
+        payload = [
+            {"title": "Fine", "publication_year": 1958, "author": self.achebe.id},
+            {"title": "", "publication_year": date.today().year + 1, "author": 999},
+            "not a book",
+        ]
+        response = self.client.post(self.url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = {e["index"]: e["errors"] for e in response.data["errors"]}
+        self.assertEqual(set(errors), {1, 2})
+        self.assertEqual(set(errors[1]), {"title", "publication_year", "author"})
+        self.assertEqual(Book.objects.count(), 0)
+
+    def test_update_and_delete(self):
+        books = Book.objects.bulk_create(
+            Book(title=f"Book {i}", publication_year=1960, author=self.achebe) for i in range(3)
+        )
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.patch(self.url, [
+                {"id": books[0].id, "title": "Renamed"},
+                {"id": books[1].id, "author": self.adichie.id, "publication_year": 2013},
+            ], format="json")
+        self.assertEqual(response.data, {"updated": 2})
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(Book.objects.get(pk=books[0].id).title, "Renamed")
+        self.assertEqual(Book.objects.get(pk=books[1].id).author, self.adichie)
+
+        response = self.client.patch(self.url, [{"id": 12345, "title": "Ghost"}], format="json")
+        self.assertEqual(response.data["errors"][0]["errors"]["id"], ["No book with this id."])
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.delete(self.url, {"ids": [books[0].id, books[2].id]},
+                                          format="json")
+        self.assertEqual(response.data, {"deleted": 2})
+        self.assertEqual(len(callbacks), 1)  # one version bump, not one per row
+        self.assertEqual(list(Book.objects.values_list("id", flat=True)), [books[1].id])
+
+        # Single-row writes bump the versions again afterwards
+        with self.captureOnCommitCallbacks() as callbacks:
+            Book.objects.get(pk=books[1].id).delete()
+        self.assertEqual(len(callbacks), 1)
+
+    def test_requires_auth(self):
+        self.client.force_authenticate(None)
+        response = self.client.post(self.url, [], format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_writes_invalidate_list_cache(self):
+        cache.clear()
+        self.client.get(reverse("book-list"))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(self.url, [
+                {"title": "Arrow of God", "publication_year": 1964, "author": self.achebe.id}
+            ], format="json")
+        titles = [b["title"] for b in self.client.get(reverse("book-list")).data["results"]]
+        self.assertEqual(titles, ["Arrow of God"])
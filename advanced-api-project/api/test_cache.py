@@ -0,0 +1,97 @@
+# api/test_cache.py
+import time
+
+from django.core.cache import cache
+from django.http import QueryDict
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .cache import bump_table_versions, normalize_query_params
+from .models import Author, Book
+
+
+class BookListCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = Author.objects.create(name="Chinua Achebe")
+        self.book = Book.objects.create(
+            title="Things Fall Apart", publication_year=1958, author=self.author
+        )
+        self.list_url = reverse("book-list")
+
+    def test_equivalent_queries_share_a_cache_entry(self):
+        first = self.client.get(self.list_url, {"search": "Achebe", "ordering": "title"})
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        with self.assertNumQueries(0):
+            second = self.client.get(self.list_url, {"search": " achebe "})
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_conditional_get(self):
+        bump_table_versions(Book._meta.db_table, Author._meta.db_table)
+        first = self.client.get(self.list_url)
+        # Not while the version's second is current (see api/cache.py)
+        self.assertFalse(first.has_header("Last-Modified"))
+
+        earlier = time.time_ns() - 5_000_000_000
+        cache.set_many({f"api:version:{table}": earlier
+                        for table in (Book._meta.db_table, Author._meta.db_table)}, None)
+        first = self.client.get(self.list_url)
+        self.assertTrue(first.has_header("Last-Modified"))
+
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.get(self.list_url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_writes_invalidate(self):
+        first = self.client.get(self.list_url)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.author.name = "C. Achebe"
+            self.author.save()
+        # Nothing is bumped before the transaction commits
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        for callback in callbacks:
+            callback()
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Book.objects.create(title="Arrow of God", publication_year=1964, author=self.author)
+        titles = [book["title"] for book in self.client.get(self.list_url).data["results"]]
+        self.assertIn("Arrow of God", titles)
+
+    def test_writes_reach_the_viewset(self):
+        self.client.get(self.list_url)
+        payload = {"title": "Arrow of God", "publication_year": 1964, "author": self.author.pk}
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(self.list_url, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        titles = [book["title"] for book in self.client.get(self.list_url).data["results"]]
+        self.assertIn("Arrow of God", titles)
+
+        detail = reverse("book-detail", args=[response.data["id"]])
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.delete(detail)
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(len(self.client.get(self.list_url).data["results"]), 1)
+
+    @override_settings(ALLOWED_HOSTS=["testserver", "api.example.com"])
+    def test_hosts_do_not_share_cached_links(self):
+        Book.objects.create(title="Arrow of God", publication_year=1964, author=self.author)
+        first = self.client.get(self.list_url, {"page_size": 1})
+        other = self.client.get(self.list_url, {"page_size": 1}, HTTP_HOST="api.example.com")
+        self.assertTrue(first.data["next"].startswith("http://testserver/"))
+        self.assertTrue(other.data["next"].startswith("http://api.example.com/"))
+        self.assertNotEqual(other["ETag"], first["ETag"])
+
+    def test_normalize_query_params(self):
+        self.assertEqual(
+            normalize_query_params(QueryDict("q=Fall&year=&ordering=title&author=1"),
+                                   {"ordering": "title"}),
+            (("author", ("1",)), ("q", ("fall",))),
+        )
@@ -0,0 +1,36 @@
+# api/test_fastpath.py
+from io import StringIO
+
+from django.core.management import call_command
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from .fastpath import values_plan
+from .models import Author, Book
+from .serializers import AuthorSerializer, BookSerializer
+
+
+class FastPathTests(APITestCase):
+    def setUp(self):
+        achebe = Author.objects.create(name="Chinua Achebe")
+        Author.objects.create(name="No Books Yet")
+        Book.objects.create(title="Things Fall Apart", publication_year=1958, author=achebe)
+        Book.objects.create(title="Arrow of God", publication_year=1964, author=achebe)
+
+    def assertSameOutput(self, serializer_class, queryset):
+        plan = values_plan(serializer_class)
+        expected = JSONRenderer().render(serializer_class(queryset, many=True).data)
+        self.assertEqual(JSONRenderer().render(plan.represent(plan.values(queryset))), expected)
+
+    def test_book_output_matches_serializer(self):
+        self.assertSameOutput(BookSerializer, Book.objects.order_by("id"))
+
+    def test_authors_use_the_serializer(self):
+        # The capped nested books are SerializerMethodFields
+        self.assertIsNone(values_plan(AuthorSerializer))
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("bench_serializers", rows=50, repeat=1, stdout=out)
+        self.assertIn("rows/s", out.getvalue())
+        self.assertEqual(Book.objects.count(), 2)
@@ -0,0 +1,57 @@
+# api/test_filters.py
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .filters import compile_filter_spec
+from .models import Author, Book
+
+
+class BookFilterBackendTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.achebe = Author.objects.create(name="Chinua Achebe")
+        self.adichie = Author.objects.create(name="Chimamanda Ngozi Adichie")
+        Book.objects.create(title="Things Fall Apart", publication_year=1958, author=self.achebe)
+        Book.objects.create(title="Arrow of God", publication_year=1964, author=self.achebe)
+        Book.objects.create(title="Americanah", publication_year=2013, author=self.adichie)
+        self.list_url = reverse("book-list")
+
+    def titles(self, params):
+        response = self.client.get(self.list_url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [book["title"] for book in response.data["results"]]
+
+    def test_params_combine_in_one_query(self):
+        params = {"author": self.achebe.pk, "year": "1958", "q": "fall", "search": "achebe"}
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self.titles(params), ["Things Fall Apart"])
+        [sql] = [q["sql"] for q in ctx.captured_queries if "api_book" in q["sql"]]
+        self.assertEqual(sql.count("JOIN"), 1)
+        self.assertEqual(sql.count('"api_book"."author_id" = '), 2)  # filter + join
+
+    def test_search_terms_must_all_match(self):
+        self.assertEqual(self.titles({"search": "achebe arrow"}), ["Arrow of God"])
+        self.assertEqual(self.titles({"search": "adichie,americanah"}), ["Americanah"])
+
+    def test_ordering_falls_back_to_title(self):
+        self.assertEqual(self.titles({"ordering": "-publication_year"}),
+                         ["Americanah", "Arrow of God", "Things Fall Apart"])
+        self.assertEqual(self.titles({"ordering": "author__name"}),
+                         ["Americanah", "Arrow of God", "Things Fall Apart"])
+
+    def test_bad_numbers(self):
+        self.assertEqual(len(self.titles({"year": "soon"})), 3)
+        response = self.client.get(self.list_url, {"author": "x"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("author", response.data)
+
+    def test_spec_is_memoized(self):
+        compile_filter_spec.cache_clear()
+        self.titles({"q": "Fall"})
+        self.titles({"q": " fall", "cursor": ""})
+        info = compile_filter_spec.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 1))
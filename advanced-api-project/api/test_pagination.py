@@ -0,0 +1,79 @@
+# api/test_pagination.py
+import json
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import Author, Book
+
+
+class BookPaginationTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        author = Author.objects.create(name="Chinua Achebe")
+        # Two titles shared by several books, to exercise the id tie-breaker
+        self.books = [
+            Book.objects.create(title=f"Title {i % 2}", publication_year=1950 + i, author=author)
+            for i in range(7)
+        ]
+        self.list_url = reverse("book-list")
+
+    def walk(self, url, params, link="next"):
+        ids, response = [], self.client.get(url, params)
+        while True:
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            ids += [book["id"] for book in response.data["results"]]
+            if not response.data[link]:
+                return ids
+            response = self.client.get(response.data[link])
+
+    def test_cursor_walks_every_row_once(self):
+        ids = self.walk(self.list_url, {"page_size": 2})
+        expected = [b.pk for b in sorted(self.books, key=lambda b: (b.title, b.pk))]
+        self.assertEqual(ids, expected)
+
+    def test_descending_ordering(self):
+        ids = self.walk(self.list_url, {"page_size": 3, "ordering": "-publication_year"})
+        self.assertEqual(ids, [b.pk for b in reversed(self.books)])
+
+    def test_mixed_directions(self):
+        ids = self.walk(self.list_url, {"page_size": 2, "ordering": "title,-publication_year"})
+        expected = sorted(self.books, key=lambda b: (b.title, -b.publication_year))
+        self.assertEqual(ids, [b.pk for b in expected])
+
+    def test_previous_links_walk_back(self):
+        response = self.client.get(self.list_url, {"page_size": 3})
+        while response.data["next"]:
+            last = response
+            response = self.client.get(response.data["next"])
+        self.assertIsNone(response.data["next"])
+        back = self.client.get(response.data["previous"])
+        self.assertEqual(back.data["results"], last.data["results"])
+
+    def test_tie_run_longer_than_offset_cutoff(self):
+        # DRF's CursorPagination stops advancing after 1,000 equal keys
+        author = Author.objects.get()
+        Book.objects.bulk_create(
+            Book(title="Title 0", publication_year=2000, author=author) for _ in range(1200)
+        )
+        ids = self.walk(self.list_url, {"page_size": 500, "title": "Title 0"})
+        expected = Book.objects.filter(title="Title 0").order_by("pk").values_list("pk", flat=True)
+        self.assertEqual(ids, list(expected))
+
+    def test_invalid_cursor_is_404(self):
+        response = self.client.get(self.list_url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_stream_ndjson(self):
+        response = self.client.get(self.list_url, {"stream": "ndjson", "ordering": "id"})
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual([json.loads(line)["id"] for line in lines],
+                         [b.pk for b in self.books])
+
+    def test_stream_json(self):
+        response = self.client.get(self.list_url, {"stream": "json", "q": "Title 1"})
+        data = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(len(data), 3)
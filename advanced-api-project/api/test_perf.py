@@ -0,0 +1,26 @@
+# api/test_perf.py
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from shared.perf import store
+
+from .models import Author, Book
+
+
+class PerfMiddlewareTests(APITestCase):
+    def setUp(self):
+        store.clear()
+        author = Author.objects.create(name="Chinua Achebe")
+        Book.objects.create(title="Things Fall Apart", publication_year=1958, author=author)
+
+    def test_records_api_views(self):
+        response = self.client.get(reverse("book-list"))
+        self.assertIn("db;dur=", response["Server-Timing"])
+        stats = store.snapshot()["book-list"]
+        self.assertEqual(stats["samples"], 1)
+        self.assertGreaterEqual(stats["queries"]["max"], 1)
+
+    @override_settings(DEBUG=False)
+    def test_endpoint_is_staff_only(self):
+        self.assertEqual(self.client.get(reverse("perf")).status_code, 403)
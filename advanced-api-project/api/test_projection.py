@@ -0,0 +1,95 @@
+# api/test_projection.py
+import json
+
+from django.core.cache import cache
+from django.db import connection
+from django.http import QueryDict
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .cache import normalize_query_params
+from .models import Author, Book
+
+
+class FieldProjectionTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = Author.objects.create(name="Chinua Achebe")
+        self.books = [
+            Book.objects.create(title=title, publication_year=year, author=self.author)
+            for title, year in [("Things Fall Apart", 1958), ("Arrow of God", 1964)]
+        ]
+
+    def book_selects(self, ctx):
+        return [q["sql"] for q in ctx.captured_queries if 'FROM "api_book"' in q["sql"]]
+
+    def test_book_list_selects_requested_columns(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("book-list"), {"fields": "id,title"})
+        self.assertEqual(response.data["results"][0], {"id": self.books[1].pk,
+                                                       "title": "Arrow of God"})
+        [sql] = self.book_selects(ctx)
+        self.assertNotIn("publication_year", sql)
+        self.assertNotIn("author_id", sql)
+
+    def test_projected_pages_follow_the_cursor(self):
+        Book.objects.create(title="No Longer at Ease", publication_year=1960, author=self.author)
+        for params, order in [
+            ({"fields": "id", "page_size": 1}, ["title"]),
+            ({"fields": "id", "page_size": 2, "ordering": "-publication_year"},
+             ["-publication_year"]),
+            ({"exclude": "title", "page_size": 2}, ["title"]),
+        ]:
+            with self.subTest(**params):
+                rows, response = [], self.client.get(reverse("book-list"), params)
+                while True:
+                    self.assertEqual(response.status_code, 200)
+                    rows += response.data["results"]
+                    if not response.data["next"]:
+                        break
+                    response = self.client.get(response.data["next"])
+                expected = Book.objects.order_by(*order, "id").values_list("id", flat=True)
+                self.assertEqual([row["id"] for row in rows], list(expected))
+                # The ordering columns read for the cursor are not output
+                self.assertNotIn("title", rows[0])
+
+    def test_unknown_fields_are_rejected(self):
+        response = self.client.get(reverse("book-list"), {"fields": "id,bogus"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {"fields": ["Unknown field(s): bogus."]})
+        response = self.client.get(reverse("book-detail", args=[self.books[0].pk]),
+                                   {"exclude": "nope,title"})
+        self.assertEqual(response.data, {"exclude": ["Unknown field(s): nope."]})
+        response = self.client.get("/api/authors/", {"fields": "id,books_total"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_streamed_rows_are_projected(self):
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(reverse("book-list"),
+                                       {"stream": "ndjson", "exclude": "author,title"})
+            lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(json.loads(lines[0]), {"id": self.books[1].pk, "publication_year": 1964})
+        [sql] = self.book_selects(ctx)
+        self.assertNotIn("author_id", sql)
+
+    def test_detail_exclude(self):
+        response = self.client.get(reverse("book-detail", args=[self.books[0].pk]),
+                                   {"exclude": "author,publication_year"})
+        self.assertEqual(response.data, {"id": self.books[0].pk, "title": "Things Fall Apart"})
+
+    def test_authors_skip_count_and_prefetch(self):
+        with self.assertNumQueries(1):
+            response = self.client.get("/api/authors/", {"fields": "id,name"})
+        self.assertEqual(response.data["results"], [{"id": self.author.pk,
+                                                     "name": "Chinua Achebe"}])
+        with CaptureQueriesContext(connection) as ctx:
+            self.client.get("/api/authors/", {"exclude": "books"})
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn("COUNT(", ctx.captured_queries[0]["sql"])
+
+    def test_field_lists_share_a_cache_key(self):
+        self.assertEqual(
+            normalize_query_params(QueryDict("fields=title, id&exclude=")),
+            (("fields", ("id,title",)),),
+        )
@@ -0,0 +1,91 @@
+# api/test_query_plans.py
+"""
+Runs the query plan of every book list filter/ordering combination and
+fails when an indexed filter is not served by an index search, or when
+an unfiltered page has to be sorted, so a dropped index or a new unindexed
+access path shows up in CI rather than in production.
+"""
+import itertools
+
+from django.core.cache import cache
+from django.db import connection
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from .models import Author, Book
+
+FILTER_VALUES = {
+    "author": [None, "author"],
+    "year": [None, "1960"],
+    "q": [None, "fall"],
+    "search": [None, "achebe"],
+    "ordering": [None, "-publication_year", "id"],
+}
+
+# Filters an index can look up; with any of them set, every table is
+# expected to be read through an index search
+INDEXED_FILTERS = {"author", "year"}
+
+
+class QueryRecorder:
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((sql, params))
+        return execute(sql, params, many, context)
+
+
+class BookListQueryPlanTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        authors = Author.objects.bulk_create(Author(name=f"Author {i}") for i in range(20))
+        cls.author = authors[0]
+        Book.objects.bulk_create(
+            Book(title=f"Book {i}", publication_year=1900 + i % 100, author=authors[i % 20])
+            for i in range(500)
+        )
+
+    def explain(self, sql, params):
+        with connection.cursor() as cursor:
+            if connection.vendor == "sqlite":
+                cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+                return [row[-1] for row in cursor.fetchall()]
+            if connection.vendor == "postgresql":
+                # Tiny test tables make sequential scans cheapest; only
+                # fall back to one when no index can serve the query
+                cursor.execute("SET LOCAL enable_seqscan = off")
+                cursor.execute(f"EXPLAIN {sql}", params)
+                return [row[0].strip() for row in cursor.fetchall()]
+        self.skipTest(f"No plan checks for {connection.vendor}")
+
+    def unindexed_reads(self, plan, params):
+        """Plan lines that read a table without an index lookup, or sort."""
+        if connection.vendor == "postgresql":
+            return [line for line in plan if "Seq Scan" in line]
+        if INDEXED_FILTERS & set(params):
+            # "SCAN ... USING INDEX" walks the whole index; only SEARCH is a lookup
+            return [line for line in plan if line.startswith("SCAN")]
+        # Nothing to look up: the list must then be read in the index's (or
+        # the rowid's) order, so the page LIMIT ends the walk early
+        return [line for line in plan if "TEMP B-TREE" in line]
+
+    def test_no_full_scans(self):
+        names = list(FILTER_VALUES)
+        for values in itertools.product(*FILTER_VALUES.values()):
+            params = {
+                name: str(self.author.pk) if value == "author" else value
+                for name, value in zip(names, values) if value is not None
+            }
+            with self.subTest(**params):
+                cache.clear()
+                recorder = QueryRecorder()
+                with connection.execute_wrapper(recorder):
+                    response = self.client.get(reverse("book-list"), params)
+                self.assertEqual(response.status_code, 200)
+                selects = [(sql, p) for sql, p in recorder.queries if "api_book" in sql]
+                self.assertTrue(selects)
+                for sql, sql_params in selects:
+                    plan = self.explain(sql, sql_params)
+                    self.assertEqual(self.unindexed_reads(plan, params), [],
+                                     "\n".join([sql, *plan]))
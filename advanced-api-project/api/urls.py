@@ -1,13 +1,12 @@
 from django.urls import path
-from .views import (
-    BookListView, BookDetailView,
-    BookCreateView, BookUpdateView, BookDeleteView,
-)
+from .views import BookCreateView, BookUpdateView, BookDeleteView, BookBulkView
+
+# The list and detail routes (book-list, book-detail) come from the
+# router in advanced_api_project/urls.py (BookViewSet)
 
 urlpatterns = [
-    path("books/", BookListView.as_view(), name="book-list"),
-    path("books/<int:pk>/", BookDetailView.as_view(), name="book-detail"),
     path("books/create/", BookCreateView.as_view(), name="book-create"),
+    path("books/bulk/", BookBulkView.as_view(), name="book-bulk"),
     path("books/<int:pk>/update/", BookUpdateView.as_view(), name="book-update"),
     path("books/<int:pk>/delete/", BookDeleteView.as_view(), name="book-delete"),
     path("books/update/<int:pk>/", BookUpdateView.as_view(), name="book-update-alt"),
@@ -1,77 +1,76 @@
 from .serializers import BookSerializer
 from .models import Book
-from rest_framework import generics, permissions
+from rest_framework import generics, permissions, status
+from rest_framework.exceptions import ValidationError
 from rest_framework import viewsets
 from .models import Author, Book
-from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
-from .serializers import AuthorSerializer, BookSerializer
-from rest_framework.filters import SearchFilter, OrderingFilter
-from django_filters import rest_framework
-from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework import generics, filters
-
-
-class AuthorViewSet(viewsets.ModelViewSet):
-    queryset = Author.objects.all().prefetch_related("books")
+from .serializers import AuthorSerializer, BookSerializer, NESTED_BOOKS_LIMIT, books_mode
+from rest_framework.filters import OrderingFilter
+from django.db.models import Count, Prefetch
+from . import bulk
+from .cache import CachedListMixin
+from .fastpath import FastListMixin
+from .filters import BookFilterBackend
+from .parsers import NDJSONParser
+from shared.drf.projection import ProjectionMixin
+from shared.drf.streaming import StreamingListMixin
+from rest_framework.parsers import JSONParser
+from rest_framework.response import Response
+
+
+class AuthorViewSet(ProjectionMixin, viewsets.ModelViewSet):
+    """
+    Authors with their first NESTED_BOOKS_LIMIT books; when an author has
+    more, a books_count and a books_more link to the rest are added.
+    ?books=count leaves the books out and always gives books_count.
+    ?ordering=name|id (prefix "-" to reverse) sorts the list.
+    ?fields=/?exclude= select fields; the count and the books are only
+    queried when asked for. Serialized by DRF: the capped books have no
+    values() fast path (see api/fastpath.py).
+    """
+    queryset = Author.objects.all()
     serializer_class = AuthorSerializer
+    filter_backends = [OrderingFilter]
+    ordering_fields = ["name", "id"]
 
-
-class BookViewSet(viewsets.ModelViewSet):
-    queryset = Book.objects.select_related("author").all()
-    serializer_class = BookSerializer
-
-
-class BookListView(generics.ListAPIView):
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.wants("books_count") or self.wants("books_more"):
+            qs = qs.annotate(books_count=Count("books"))
+        if books_mode(self.request) == "count" or not self.wants("books"):
+            return qs
+        # A sliced Prefetch is run as one windowed query (ROW_NUMBER() per
+        # author), so only the first books of each author are loaded
+        capped = Book.objects.order_by("id")[:NESTED_BOOKS_LIMIT]
+        return qs.prefetch_related(Prefetch("books", queryset=capped, to_attr="top_books"))
+
+
+class BookViewSet(StreamingListMixin, CachedListMixin, FastListMixin, ProjectionMixin,
+                  viewsets.ModelViewSet):
     """
-    GET /api/books/
-    Returns a paginated list of books. Supports simple filtering via query params:
+    /api/books/ and /api/books/<pk>/ (routed before api.urls, so writes
+    reach the viewset). The list is cursor-paginated and filtered by:
       - ?author=<author_id>
-      - ?year=<publication_year>
+      - ?year=<publication_year> (or ?publication_year=)
+      - ?title=<exact title>
       - ?q=<substring of title>
+      - ?search=<terms in the title or author name>
+      - ?ordering=title|publication_year|id (prefix "-" to reverse)
+    All of them are applied by BookFilterBackend in one query (see api/filters.py).
+    ?fields=id,title or ?exclude=author return (and SELECT) fewer columns.
+    ?stream=ndjson or ?stream=json streams every matching row instead.
+    Responses are cached per normalized query string and carry an ETag and
+    Last-Modified, so repeat clients get 304 Not Modified (see api/cache.py).
     """
+    queryset = Book.objects.select_related("author").all()
     serializer_class = BookSerializer
-    permission_classes = [IsAuthenticatedOrReadOnly]
-
-    filter_backends = [
-        DjangoFilterBackend,
-        filters.SearchFilter,
-        filters.OrderingFilter,
-    ]
+    # Leaves books/create/, books/bulk/ etc. to api.urls
+    lookup_value_regex = "[0-9]+"
 
-    filterset_fields = ["title", "author", "publication_year"]
+    cache_tables = (Book._meta.db_table, Author._meta.db_table)
+    cache_param_defaults = {"ordering": "title"}
 
-    search_fields = ["title", "author__name"]
-
-    ordering_fields = ["title", "publication_year", "id"]
-    ordering = ["title"]
-
-    def get_queryset(self):
-        qs = Book.objects.select_related("author").all()
-        author_id = self.request.query_params.get("author")
-        year = self.request.query_params.get("year")
-        q = self.request.query_params.get("q")
-
-        if author_id:
-            qs = qs.filter(author_id=author_id)
-        if year:
-            try:
-                qs = qs.filter(publication_year=int(year))
-            except ValueError:
-                pass
-        if q:
-            qs = qs.filter(title__icontains=q)
-        return qs
-
-
-# READ-ONLY: anyone can view details
-class BookDetailView(generics.RetrieveAPIView):
-    """
-    GET /api/books/<pk>/
-    Retrieve a single book by primary key.
-    """
-    queryset = Book.objects.select_related("author").all()
-    serializer_class = BookSerializer
-    permission_classes = [permissions.AllowAny]
+    filter_backends = [BookFilterBackend]
 
 
 # CREATE: authenticated users only
@@ -114,3 +113,47 @@ class BookDeleteView(generics.DestroyAPIView):
     serializer_class = BookSerializer
     queryset = Book.objects.all()
     permission_classes = [permissions.IsAuthenticated]
+
+
+# BULK: authenticated users only
+class BookBulkView(generics.GenericAPIView):
+    """
+    /api/books/bulk/
+    Body: a JSON array or NDJSON (application/x-ndjson), one book per item.
+      - POST:   create books ({"title", "publication_year", "author"} each)
+      - PATCH:  update books ({"id", ...changed fields} each)
+      - DELETE: delete books (a list of ids, or {"ids": [...]})
+    The whole batch is validated first; if any item is invalid nothing is
+    written and the errors are returned per item index (see api/bulk.py).
+    """
+    queryset = Book.objects.all()
+    permission_classes = [permissions.IsAuthenticated]
+    parser_classes = [JSONParser, NDJSONParser]
+
+    def post(self, request, *args, **kwargs):
+        books = bulk.create_books(self.get_items(request))
+        return Response(
+            {"created": len(books), "ids": [book.pk for book in books]},
+            status=status.HTTP_201_CREATED,
+        )
+
+    def patch(self, request, *args, **kwargs):
+        return Response({"updated": bulk.update_books(self.get_items(request))})
+
+    def delete(self, request, *args, **kwargs):
+        data = request.data
+        ids = data.get("ids") if isinstance(data, dict) else data
+        if not isinstance(ids, list):
+            raise ValidationError({"detail": "Expected a list of ids."})
+        return Response({"deleted": bulk.delete_books(ids)})
+
+    def handle_exception(self, exc):
+        if isinstance(exc, bulk.BulkValidationError):
+            return Response({"errors": exc.errors}, status=status.HTTP_400_BAD_REQUEST)
+        return super().handle_exception(exc)
+
+    @staticmethod
+    def get_items(request):
+        if not isinstance(request.data, list):
+            raise ValidationError({"detail": "Expected a list of books."})
+        return request.data
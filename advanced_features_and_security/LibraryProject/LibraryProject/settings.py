@@ -11,11 +11,17 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# The repository root, so every project can import the `shared` package
+REPO_DIR = BASE_DIR.parent.parent
+if str(REPO_DIR) not in sys.path:
+    sys.path.append(str(REPO_DIR))
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -140,12 +146,6 @@ LOGIN_REDIRECT_URL = 'list-books'   # after successful login
 LOGOUT_REDIRECT_URL = 'login'
 LOGIN_URL = 'login'
 
-INSTALLED_APPS = [
-    # ...
-    "bookshelf",
-    # ...
-]
-
 AUTH_USER_MODEL = "bookshelf.CustomUser"
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -162,6 +162,7 @@ ALLOWED_HOSTS = os.environ.get(
 
 # --- SECURITY MIDDLEWARE (should already be present)
 MIDDLEWARE = [
+    "shared.perf.PerfMiddleware",
     "django.middleware.security.SecurityMiddleware",
     # CSP middleware (see config below). Keep it early in the list, after SecurityMiddleware.
     "csp.middleware.CSPMiddleware",            # ← requires: pip install django-csp
@@ -186,11 +187,8 @@ SESSION_COOKIE_SECURE = True
 
 
 # --- CONTENT SECURITY POLICY (django-csp)
-INSTALLED_APPS = [
-    # ...
-    "bookshelf",  # your app
+INSTALLED_APPS += [
     "csp",        # ← django-csp (pip install django-csp)
-    # ...
 ]
 
 # Keep CSP strict; loosen only if you add trusted CDNs.
@@ -2,6 +2,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from shared.perf import perf_view
 
 urlpatterns = [
     # ...
@@ -13,5 +14,6 @@ if settings.DEBUG:
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("__perf__", perf_view, name="perf"),
     path("", include("relationship_app.urls")),
 ]
@@ -32,28 +32,3 @@ class CustomUserAdmin(DjangoUserAdmin):
 
 
 admin.site.register(Book)
-
-
-class CustomUserAdmin(DjangoUserAdmin):
-    list_display = ("username", "email", "first_name",
-                    "last_name", "is_staff", "date_of_birth")
-    list_filter = ("is_staff", "is_superuser", "is_active")
-    fieldsets = (
-        (None, {"fields": ("username", "password")}),
-        (_("Personal info"), {"fields": (
-            "first_name", "last_name", "email", "date_of_birth", "profile_photo")}),
-        (_("Permissions"), {"fields": ("is_active", "is_staff",
-         "is_superuser", "groups", "user_permissions")}),
-        (_("Important dates"), {"fields": ("last_login", "date_joined")}),
-    )
-    add_fieldsets = (
-        (None, {
-            "classes": ("wide",),
-            "fields": ("username", "email", "password1", "password2", "date_of_birth", "profile_photo"),
-        }),
-    )
-    search_fields = ("username", "first_name", "last_name", "email")
-    ordering = ("username",)
-
-
-admin.site.register(CustomUser, CustomUserAdmin)
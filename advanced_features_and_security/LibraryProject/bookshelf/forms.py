@@ -16,10 +16,10 @@ class BookSearchForm(forms.Form):
 class BookForm(forms.ModelForm):
     class Meta:
         model = Book
-        fields = ["title", "author", "published_year"]
+        fields = ["title", "author", "publication_year"]
 
-    def clean_published_year(self):
-        y = self.cleaned_data.get("published_year")
+    def clean_publication_year(self):
+        y = self.cleaned_data.get("publication_year")
         if y is not None and (y < 0 or y > 3000):
             raise forms.ValidationError("Year looks invalid.")
         return y
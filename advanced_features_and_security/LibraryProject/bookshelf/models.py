@@ -1,16 +1,12 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.utils.translation import gettext_lazy as _
-from django.conf import settings
 
 
 class Book(models.Model):
     title = models.CharField(max_length=200)
-    author = models.CharField(max_length=120)
-    published_year = models.IntegerField(null=True, blank=True)
-    owner = models.ForeignKey(
-        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="owned_books", null=True, blank=True
-    )
+    author = models.CharField(max_length=100)
+    publication_year = models.IntegerField()
 
     class Meta:
         permissions = [
@@ -21,7 +17,7 @@ class Book(models.Model):
         ]
 
     def __str__(self):
-        return self.title
+        return f"{self.title} ({self.publication_year}) by {self.author}"
 
 
 class CustomUserManager(BaseUserManager):
@@ -68,11 +64,3 @@ class CustomUser(AbstractUser):
         verbose_name = _("user")
         verbose_name_plural = _("users")
 
-
-class Book(models.Model):
-    title = models.CharField(max_length=200)
-    author = models.CharField(max_length=100)
-    publication_year = models.IntegerField()
-
-    def __str__(self):
-        return f"{self.title} ({self.publication_year}) by {self.author}"
@@ -1,5 +1,5 @@
+from django.conf import settings
 from django.db import models
-from django.contrib.auth.models import User
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
@@ -23,6 +23,14 @@ class Book(models.Model):
     def __str__(self):
         return f"{self.title} ({self.author.name})"
 
+    # <-- add this block exactly
+    class Meta:
+        permissions = (
+            ("can_add_book", "Can add book"),
+            ("can_change_book", "Can change book"),
+            ("can_delete_book", "Can delete book"),
+        )
+
 
 class Library(models.Model):
     name = models.CharField(max_length=255)
@@ -57,7 +65,7 @@ class UserProfile(models.Model):  # <-- exact string the grader expects
         ('Member', 'Member'),
     ]
     user = models.OneToOneField(
-        User, on_delete=models.CASCADE, related_name='profile')
+        settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='profile')
     role = models.CharField(
         max_length=20, choices=ROLE_CHOICES, default='Member')
 
@@ -65,30 +73,13 @@ class UserProfile(models.Model):  # <-- exact string the grader expects
         return f"{self.user.username} ({self.role})"
 
 
-@receiver(post_save, sender=User)
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         UserProfile.objects.create(user=instance)  # default role='Member'
 
 
-@receiver(post_save, sender=User)
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def save_user_profile(sender, instance, **kwargs):
     if hasattr(instance, 'profile'):
         instance.profile.save()
-
-
-class Book(models.Model):
-    title = models.CharField(max_length=255)
-    author = models.ForeignKey(
-        Author, on_delete=models.CASCADE, related_name="books")
-
-    def __str__(self):
-        return f"{self.title} ({self.author.name})"
-
-    # <-- add this block exactly
-    class Meta:
-        permissions = (
-            ("can_add_book", "Can add book"),
-            ("can_change_book", "Can change book"),
-            ("can_delete_book", "Can delete book"),
-        )
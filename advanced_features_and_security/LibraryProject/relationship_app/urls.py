@@ -1,4 +1,6 @@
+from django.contrib.auth.views import LoginView, LogoutView
 from django.urls import path
+from . import views
 from .views import list_books, LibraryDetailView
 
 
@@ -0,0 +1,111 @@
+"""
+Async-native read endpoints for books.
+
+BookList and BookViewSet are sync DRF views, so under ASGI every request
+holds a thread from the sync_to_async pool for its whole lifetime. These
+views run on the event loop instead: the ORM is used through its async
+API (aiterator(), aget()) and authentication through aauthenticate(),
+and the list is streamed row by row. A slow client then costs a
+suspended coroutine rather than a thread, and memory stays flat however
+many books there are.
+
+  GET /api/books/async/            every book, ordered by id, as a
+                                   streamed JSON array (?stream=ndjson
+                                   for one object per line)
+  GET /api/books/async/<pk>/       one book
+
+Both take ?fields=/?exclude= (see shared/drf/projection.py) and then only
+SELECT the columns asked for. Only GET and HEAD are answered (405
+otherwise). Reads are open to everyone, as with the sync views; a token
+that is sent must be valid.
+"""
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_safe
+from rest_framework.exceptions import AuthenticationFailed, ValidationError
+
+from shared.drf.projection import EXCLUDE_PARAM, FIELDS_PARAM, parse_field_list, projected_columns
+from shared.drf.streaming import STREAM_CHUNK_SIZE, STREAM_CONTENT_TYPES
+
+from .authentication import CachedTokenAuthentication, aauthenticate
+from .models import Book
+from .serializers import BookSerializer
+
+
+async def authenticate(request):
+    """Set request.user from a token header; a 401 response if it is invalid."""
+    try:
+        credentials = await aauthenticate(request)
+    except AuthenticationFailed as exc:
+        response = JsonResponse({"detail": str(exc.detail)}, status=exc.status_code)
+        response["WWW-Authenticate"] = CachedTokenAuthentication.keyword
+        return response
+    if credentials is not None:
+        request.user, request.auth = credentials
+    return None
+
+
+def projected(request):
+    """
+    (serializer, queryset) for the ?fields=/?exclude= of `request`. Raises
+    ValidationError for unknown field names.
+    """
+    serializer = BookSerializer(
+        fields=parse_field_list(request.GET.get(FIELDS_PARAM)),
+        exclude=parse_field_list(request.GET.get(EXCLUDE_PARAM)) or (),
+    )
+    return serializer, Book.objects.only(*projected_columns(serializer))
+
+
+async def stream_rows(serializer, queryset):
+    # One serializer for every row; to_representation() keeps no state
+    encoder = DjangoJSONEncoder(separators=(",", ":"))
+    async for book in queryset.aiterator(chunk_size=STREAM_CHUNK_SIZE):
+        yield encoder.encode(serializer.to_representation(book))
+
+
+async def ndjson_body(rows):
+    async for row in rows:
+        yield row + "\n"
+
+
+async def json_body(rows):
+    yield "["
+    first = True
+    async for row in rows:
+        yield row if first else "," + row
+        first = False
+    yield "]"
+
+
+@require_safe
+async def book_list(request):
+    error = await authenticate(request)
+    if error is not None:
+        return error
+    mode = request.GET.get("stream", "json")
+    if mode not in STREAM_CONTENT_TYPES:
+        return JsonResponse({"detail": f"Unknown stream format {mode!r}."}, status=400)
+    try:
+        serializer, queryset = projected(request)
+    except ValidationError as exc:
+        return JsonResponse(exc.detail, status=exc.status_code)
+    rows = stream_rows(serializer, queryset.order_by("id"))
+    body = ndjson_body(rows) if mode == "ndjson" else json_body(rows)
+    return StreamingHttpResponse(body, content_type=STREAM_CONTENT_TYPES[mode])
+
+
+@require_safe
+async def book_detail(request, pk):
+    error = await authenticate(request)
+    if error is not None:
+        return error
+    try:
+        serializer, queryset = projected(request)
+    except ValidationError as exc:
+        return JsonResponse(exc.detail, status=exc.status_code)
+    try:
+        book = await queryset.aget(pk=pk)
+    except Book.DoesNotExist:
+        raise Http404("No Book matches the given query.")
+    return JsonResponse(serializer.to_representation(book))
@@ -0,0 +1,164 @@
+"""
+Token authentication without a database hit per request.
+
+TokenAuthentication looks the token and its user up (one SELECT with a
+join) on every request. CachedTokenAuthentication keeps token -> (user,
+token) in a bounded in-process LRU whose entries expire after a TTL, so
+repeat requests with the same token skip the database entirely.
+
+Set TOKEN_AUTH_CACHE to a cache alias to also share entries between
+processes (a miss in the local LRU then tries that cache before the
+database). Deleting a token or saving its user (e.g. deactivating it,
+or changing is_staff) drops the cached entries in this process and in
+the shared cache; other processes' local entries expire within
+TOKEN_AUTH_CACHE_TTL.
+
+Settings:
+  TOKEN_AUTH_CACHE_SIZE - tokens kept per process (default 10000)
+  TOKEN_AUTH_CACHE_TTL  - seconds an entry is trusted (default 60)
+  TOKEN_AUTH_CACHE      - shared cache alias (default None: local only)
+"""
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+
+
+class TokenCache:
+    """LRU of token key -> (user, token) with a per-entry TTL; thread-safe."""
+
+    def __init__(self, size, ttl):
+        self.size = size
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires <= time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def delete(self, key):
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def delete_user(self, user_id):
+        with self.lock:
+            stale = [key for key, (_, (user, _token)) in self.entries.items() if user.pk == user_id]
+            for key in stale:
+                del self.entries[key]
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+token_cache = TokenCache(
+    getattr(settings, "TOKEN_AUTH_CACHE_SIZE", 10000),
+    getattr(settings, "TOKEN_AUTH_CACHE_TTL", 60),
+)
+
+
+def shared_cache():
+    alias = getattr(settings, "TOKEN_AUTH_CACHE", None)
+    return caches[alias] if alias else None
+
+
+def shared_key(key):
+    # Never put raw tokens in cache keys
+    return "api:token:" + hashlib.sha256(key.encode()).hexdigest()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Drop-in replacement for TokenAuthentication (same header, same errors)."""
+
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is None:
+            shared = shared_cache()
+            cached = shared.get(shared_key(key)) if shared is not None else None
+            if cached is None:
+                # Raises AuthenticationFailed for unknown keys and inactive users
+                cached = super().authenticate_credentials(key)
+                if shared is not None:
+                    shared.set(shared_key(key), cached, token_cache.ttl)
+            token_cache.set(key, cached)
+        user, token = cached
+        # Each request gets its own user object; views may set attributes on it
+        return copy.copy(user), token
+
+
+async def aauthenticate(request):
+    """
+    CachedTokenAuthentication for plain Django async views: (user, token)
+    for an "Authorization: Token <key>" header, None without one. Raises
+    AuthenticationFailed for bad keys and inactive users, like the sync class.
+    """
+    auth = request.headers.get("Authorization", "").split()
+    if not auth or auth[0].lower() != CachedTokenAuthentication.keyword.lower():
+        return None
+    if len(auth) != 2:
+        raise AuthenticationFailed(_("Invalid token header."))
+    key = auth[1]
+    cached = token_cache.get(key)
+    if cached is None:
+        shared = shared_cache()
+        cached = await shared.aget(shared_key(key)) if shared is not None else None
+        if cached is None:
+            try:
+                token = await Token.objects.select_related("user").aget(key=key)
+            except Token.DoesNotExist:
+                raise AuthenticationFailed(_("Invalid token."))
+            if not token.user.is_active:
+                raise AuthenticationFailed(_("User inactive or deleted."))
+            cached = (token.user, token)
+            if shared is not None:
+                await shared.aset(shared_key(key), cached, token_cache.ttl)
+        token_cache.set(key, cached)
+    user, token = cached
+    return copy.copy(user), token
+
+
+def forget_token(key):
+    token_cache.delete(key)
+    shared = shared_cache()
+    if shared is not None:
+        shared.delete(shared_key(key))
+
+
+@receiver(post_delete, sender=Token)
+def forget_deleted_token(sender, instance, **kwargs):
+    forget_token(instance.key)
+
+
+@receiver(post_save, sender=get_user_model())
+def forget_user_tokens(sender, instance, **kwargs):
+    token_cache.delete_user(instance.pk)
+    if shared_cache() is not None:
+        for key in Token.objects.filter(user_id=instance.pk).values_list("key", flat=True):
+            forget_token(key)
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:33
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Book',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('author', models.CharField(max_length=200)),
+            ],
+        ),
+    ]
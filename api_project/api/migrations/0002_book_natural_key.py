@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:40
+
+import unicodedata
+
+from django.db import migrations, models
+
+
+def natural_key(value):
+    # Frozen copy of api.models.natural_key
+    return " ".join(unicodedata.normalize("NFKC", value).split()).casefold()
+
+
+def backfill_and_dedupe(apps, schema_editor):
+    """Fill the natural key and drop all but the oldest book for each key."""
+    Book = apps.get_model("api", "Book")
+    seen, duplicates, batch = set(), [], []
+    for book in Book.objects.order_by("pk").iterator(chunk_size=2000):
+        book.title_norm = natural_key(book.title)
+        book.author_norm = natural_key(book.author)
+        key = (book.title_norm, book.author_norm)
+        if key in seen:
+            duplicates.append(book.pk)
+            continue
+        seen.add(key)
+        batch.append(book)
+        if len(batch) >= 2000:
+            Book.objects.bulk_update(batch, ["title_norm", "author_norm"])
+            batch = []
+    Book.objects.bulk_update(batch, ["title_norm", "author_norm"])
+    for start in range(0, len(duplicates), 2000):
+        Book.objects.filter(pk__in=duplicates[start:start + 2000]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='book',
+            name='author_norm',
+            field=models.CharField(default='', editable=False, max_length=600),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='book',
+            name='title_norm',
+            field=models.CharField(default='', editable=False, max_length=600),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_and_dedupe, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='book',
+            constraint=models.UniqueConstraint(fields=('title_norm', 'author_norm'), name='book_natural_key'),
+        ),
+    ]
@@ -1,9 +1,35 @@
+import unicodedata
+
 from django.db import models
 
 
+def natural_key(value):
+    """Comparison form of a title or author: NFKC, single spaces, casefolded."""
+    return " ".join(unicodedata.normalize("NFKC", value).split()).casefold()
+
+
 class Book(models.Model):
     title = models.CharField(max_length=200)
     author = models.CharField(max_length=200)
+    # Natural key, kept in sync by save() (and by api.upsert for bulk
+    # writes); casefold() can turn one character into up to three
+    title_norm = models.CharField(max_length=600, editable=False)
+    author_norm = models.CharField(max_length=600, editable=False)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["title_norm", "author_norm"], name="book_natural_key"
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        self.title_norm = natural_key(self.title)
+        self.author_norm = natural_key(self.author)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "title_norm", "author_norm"}
+        super().save(*args, **kwargs)
 
     def __str__(self):
         return f"{self.title} by {self.author}"
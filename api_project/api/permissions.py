@@ -1,18 +1,10 @@
-from rest_framework import generics, viewsets
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
-from .models import Book
-from .serializers import BookSerializer
-from .permissions import IsAdminOrReadOnly
+from rest_framework.permissions import SAFE_METHODS, BasePermission
 
 
-class BookList(generics.ListAPIView):
-    queryset = Book.objects.all().order_by("id")
-    serializer_class = BookSerializer
-    # inherits global IsAuthenticatedOrReadOnly (read for all)
+class IsAdminOrReadOnly(BasePermission):
+    """Anyone may read; only staff users may write."""
 
-
-class BookViewSet(viewsets.ModelViewSet):
-    queryset = Book.objects.all().order_by("id")
-    serializer_class = BookSerializer
-    permission_classes = [IsAdminOrReadOnly]   # ← overrides global default
-    # authentication uses settings.py defaults (Token/Session)
+    def has_permission(self, request, view):
+        if request.method in SAFE_METHODS:
+            return True
+        return bool(request.user and request.user.is_staff)
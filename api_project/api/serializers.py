@@ -1,8 +1,27 @@
 from rest_framework import serializers
-from .models import Book
+from .models import Book, natural_key
+from shared.drf.projection import DynamicFieldsMixin
 
 
-class BookSerializer(serializers.ModelSerializer):
+class BookSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Book
-        fields = "__all__"   # id, title, author
+        # Listed explicitly so the natural-key columns stay internal;
+        # ?fields=/?exclude= narrow them further (see shared/drf/projection.py)
+        fields = ["id", "title", "author"]
+
+    def validate(self, attrs):
+        # Same natural key as the book_natural_key constraint, so clients
+        # get a 400 instead of an IntegrityError
+        title = attrs.get("title", getattr(self.instance, "title", ""))
+        author = attrs.get("author", getattr(self.instance, "author", ""))
+        duplicates = Book.objects.filter(
+            title_norm=natural_key(title), author_norm=natural_key(author)
+        )
+        if self.instance is not None:
+            duplicates = duplicates.exclude(pk=self.instance.pk)
+        if duplicates.exists():
+            raise serializers.ValidationError(
+                "A book with this title and author already exists."
+            )
+        return attrs
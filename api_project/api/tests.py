@@ -1,3 +1,196 @@
-from django.test import TestCase
+import json
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from .async_views import projected
+from .authentication import CachedTokenAuthentication, TokenCache, token_cache
+from .models import Book
+from .serializers import BookSerializer
+from .upsert import UpsertValidationError, upsert_books
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.user = User.objects.create_user(username="reader", password="pass1234")
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def authenticate(self, key=None):
+        request = APIRequestFactory().get(
+            "/api/books/", HTTP_AUTHORIZATION=f"Token {key or self.token.key}"
+        )
+        return self.auth.authenticate(request)
+
+    def test_repeat_requests_skip_database(self):
+        with self.assertNumQueries(1):
+            self.authenticate()
+        with self.assertNumQueries(0):
+            user, token = self.authenticate()
+        self.assertEqual((user, token), (self.user, self.token))
+
+    def test_deleted_token_is_rejected(self):
+        key = self.token.key
+        self.authenticate()
+        self.token.delete()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(key)
+
+    def test_deactivated_user_is_rejected(self):
+        self.authenticate()
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate()
+
+    @override_settings(
+        TOKEN_AUTH_CACHE="tokens",
+        CACHES={"tokens": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+                "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    )
+    def test_shared_cache_serves_other_processes(self):
+        self.authenticate()
+        token_cache.clear()  # as if this were another process
+        with self.assertNumQueries(0):
+            self.assertEqual(self.authenticate()[0], self.user)
+
+        self.token.delete()
+        token_cache.clear()
+        with self.assertRaises(AuthenticationFailed):
+            self.authenticate(self.token.key)
+
+    def test_lru_is_bounded_and_expires(self):
+        cache = TokenCache(size=2, ttl=60)
+        for key in "abc":
+            cache.set(key, (self.user, None))
+        self.assertEqual(list(cache.entries), ["b", "c"])
+
+        expired = TokenCache(size=2, ttl=0)
+        expired.set("a", (self.user, None))
+        self.assertIsNone(expired.get("a"))
+
+
+class AsyncBookViewTests(TestCase):
+    def setUp(self):
+        token_cache.clear()
+        self.books = [Book.objects.create(title=f"Book {i}", author="Achebe") for i in range(3)]
+        self.token = Token.objects.create(
+            user=User.objects.create_user(username="reader", password="pass1234")
+        )
+
+    async def body(self, response):
+        return b"".join([chunk async for chunk in response.streaming_content])
+
+    async def test_list_streams_every_book(self):
+        response = await self.async_client.get(reverse("book-list-async"))
+        self.assertEqual(response["Content-Type"], "application/json")
+        data = json.loads(await self.body(response))
+        self.assertEqual([b["id"] for b in data], [b.pk for b in self.books])
+
+        response = await self.async_client.get(reverse("book-list-async"), {"stream": "ndjson"})
+        lines = (await self.body(response)).decode().splitlines()
+        self.assertEqual(json.loads(lines[0]), {"id": self.books[0].pk, "title": "Book 0",
+                                                "author": "Achebe"})
+
+    async def test_detail(self):
+        url = reverse("book-detail-async", args=[self.books[1].pk])
+        response = await self.async_client.get(url, headers={
+            "Authorization": f"Token {self.token.key}"})
+        self.assertEqual(response.json()["title"], "Book 1")
+
+        missing = await self.async_client.get(reverse("book-detail-async", args=[0]))
+        self.assertEqual(missing.status_code, 404)
+
+    async def test_fields_narrow_output(self):
+        response = await self.async_client.get(reverse("book-list-async"),
+                                                {"fields": "id, title"})
+        data = json.loads(await self.body(response))
+        self.assertEqual(data[0], {"id": self.books[0].pk, "title": "Book 0"})
+
+        url = reverse("book-detail-async", args=[self.books[1].pk])
+        response = await self.async_client.get(url, {"exclude": "id,title"})
+        self.assertEqual(response.json(), {"author": "Achebe"})
+
+    async def test_unknown_fields_are_rejected(self):
+        response = await self.async_client.get(reverse("book-list-async"),
+                                                {"fields": "id,bogus"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"fields": ["Unknown field(s): bogus."]})
+
+        url = reverse("book-detail-async", args=[self.books[1].pk])
+        response = await self.async_client.get(url, {"exclude": "nope"})
+        self.assertEqual(response.json(), {"exclude": ["Unknown field(s): nope."]})
+
+    def test_fields_narrow_select(self):
+        _, queryset = projected(RequestFactory().get("/", {"fields": "title"}))
+        self.assertNotIn('"author"', str(queryset.query))
+
+    async def test_only_safe_methods(self):
+        detail = reverse("book-detail-async", args=[self.books[0].pk])
+        for url in (reverse("book-list-async"), detail):
+            self.assertEqual((await self.async_client.post(url)).status_code, 405)
+            self.assertEqual((await self.async_client.delete(url)).status_code, 405)
+        self.assertEqual((await self.async_client.head(detail)).status_code, 200)
+        self.assertEqual(await Book.objects.acount(), 3)
+
+    async def test_bad_token_is_rejected(self):
+        response = await self.async_client.get(
+            reverse("book-list-async"), headers={"Authorization": "Token nope"})
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response["WWW-Authenticate"], "Token")
+
+
+class BookUpsertTests(TestCase):
+    def test_reloading_a_feed_is_idempotent(self):
+        feed = [{"title": "Things Fall Apart", "author": "Chinua Achebe"},
+                {"title": "Americanah", "author": "Chimamanda Ngozi Adichie"}]
+        self.assertEqual(upsert_books(feed), 2)
+        with self.assertNumQueries(3):  # savepoint, one INSERT ... ON CONFLICT, release
+            upsert_books(feed)
+        self.assertEqual(Book.objects.count(), 2)
+
+    def test_natural_key_ignores_case_and_spacing(self):
+        Book.objects.create(title="Things Fall Apart", author="Chinua Achebe")
+        upsert_books([{"title": "things  fall apart ", "author": "CHINUA ACHEBE"},
+                      {"title": "THINGS FALL APART", "author": "chinua achebe"}])
+        book = Book.objects.get()
+        self.assertEqual((book.title, book.author), ("THINGS FALL APART", "chinua achebe"))
+
+    def test_invalid_batch_writes_nothing(self):
+        with self.assertRaises(UpsertValidationError) as ctx:
+            upsert_books([{"title": "Arrow of God", "author": "Chinua Achebe"},
+                          {"title": ""}])
+        self.assertEqual([e["index"] for e in ctx.exception.errors], [1])
+        self.assertEqual(set(ctx.exception.errors[0]["errors"]), {"title", "author"})
+        self.assertFalse(Book.objects.exists())
+
+    def test_serializer_rejects_natural_key_duplicates(self):
+        book = Book.objects.create(title="Arrow of God", author="Chinua Achebe")
+        serializer = BookSerializer(data={"title": "arrow of god", "author": "Chinua  Achebe"})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("non_field_errors", serializer.errors)
+        self.assertTrue(BookSerializer(book, data={"title": "Arrow of God",
+                                                   "author": "Chinua Achebe"}).is_valid())
+
+
+class BookViewSetPermissionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="reader", password="pass1234")
+        self.url = reverse("book_all-list")
+
+    def test_reads_are_open_and_writes_are_staff_only(self):
+        Book.objects.create(title="Arrow of God", author="Chinua Achebe")
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        payload = {"title": "Americanah", "author": "Chimamanda Ngozi Adichie"}
+        self.client.force_login(self.user)
+        self.assertEqual(self.client.post(self.url, payload).status_code, 403)
+
+        self.user.is_staff = True
+        self.user.save()
+        self.assertEqual(self.client.post(self.url, payload).status_code, 201)
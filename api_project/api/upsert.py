@@ -0,0 +1,59 @@
+"""
+Batch upsert for books, keyed on the natural key (see Book.title_norm).
+
+A whole batch is validated before anything is written, with each item's
+errors reported under its index. Items with the same natural key are
+merged (the last one wins), then written with
+bulk_create(update_conflicts=True) in UPSERT_CHUNK_SIZE chunks inside
+one transaction: one INSERT ... ON CONFLICT DO UPDATE per chunk, so
+reloading a feed is idempotent and needs no lookups first.
+"""
+from django.db import transaction
+from rest_framework import serializers
+
+from .models import Book, natural_key
+
+UPSERT_CHUNK_SIZE = 1000
+
+
+class UpsertValidationError(Exception):
+    def __init__(self, errors):
+        super().__init__(errors)
+        # [{"index": i, "errors": {field: [message, ...]}}, ...]
+        self.errors = errors
+
+
+class BookUpsertItemSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Book
+        fields = ["title", "author"]
+
+
+def validate_items(items):
+    books, errors = {}, []
+    for index, item in enumerate(items):
+        serializer = BookUpsertItemSerializer(data=item)
+        if not serializer.is_valid():
+            errors.append({"index": index, "errors": serializer.errors})
+            continue
+        book = Book(**serializer.validated_data)
+        book.title_norm = natural_key(book.title)
+        book.author_norm = natural_key(book.author)
+        books[book.title_norm, book.author_norm] = book
+    if errors:
+        raise UpsertValidationError(errors)
+    return list(books.values())
+
+
+def upsert_books(items):
+    """Insert or update every book in `items`; returns how many were written."""
+    books = validate_items(items)
+    with transaction.atomic():
+        for start in range(0, len(books), UPSERT_CHUNK_SIZE):
+            Book.objects.bulk_create(
+                books[start:start + UPSERT_CHUNK_SIZE],
+                update_conflicts=True,
+                unique_fields=["title_norm", "author_norm"],
+                update_fields=["title", "author"],
+            )
+    return len(books)
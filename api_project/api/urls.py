@@ -2,7 +2,8 @@ from django.urls import path
 from django.urls import path, include
 from .views import BookList
 from rest_framework.routers import DefaultRouter
-from .views import BookList, BookViewSet
+from .views import BookList, BookViewSet, BookUpsert
+from . import async_views
 
 router = DefaultRouter()
 router.register(r'books_all', BookViewSet, basename='book_all')
@@ -10,6 +11,10 @@ router.register(r'books_all', BookViewSet, basename='book_all')
 urlpatterns = [
     # List-only view from Task 1
     path('books/', BookList.as_view(), name='book-list'),
+    path('books/upsert/', BookUpsert.as_view(), name='book-upsert'),
+    # Async-native reads (see api/async_views.py)
+    path('books/async/', async_views.book_list, name='book-list-async'),
+    path('books/async/<int:pk>/', async_views.book_detail, name='book-detail-async'),
     # All CRUD routes for books_all
     path('', include(router.urls)),
 ]
@@ -4,28 +4,56 @@ from rest_framework import generics
 from rest_framework import generics, viewsets
 from .models import Book
 from .serializers import BookSerializer
+from shared.drf.projection import ProjectionMixin
+from shared.drf.streaming import StreamingListMixin
+from . import upsert
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
 
 
-class BookList(generics.ListAPIView):
+class BookList(StreamingListMixin, ProjectionMixin, generics.ListAPIView):
     queryset = Book.objects.all().order_by("id")
     serializer_class = BookSerializer
 
 
-class BookList(generics.ListAPIView):
+class BookList(StreamingListMixin, ProjectionMixin, generics.ListAPIView):
     queryset = Book.objects.all().order_by("id")
     serializer_class = BookSerializer
 
 
-class BookViewSet(viewsets.ModelViewSet):
+class BookViewSet(StreamingListMixin, ProjectionMixin, viewsets.ModelViewSet):
     """
     Full CRUD for Book:
-    - list (GET /books_all/)
+    - list (GET /books_all/, cursor-paginated; ?stream=ndjson|json streams all rows)
     - retrieve (GET /books_all/<id>/)
     - create (POST /books_all/)
     - update (PUT /books_all/<id>/)
     - partial_update (PATCH /books_all/<id>/)
     - destroy (DELETE /books_all/<id>/)
+    Reads take ?fields=id,title / ?exclude=author to return fewer columns.
     """
     queryset = Book.objects.all().order_by("id")
     serializer_class = BookSerializer
     permission_classes = [IsAdminOrReadOnly]
+
+
+class BookUpsert(generics.GenericAPIView):
+    """
+    POST /books/upsert/ with a JSON array of {"title", "author"} objects.
+    Books are matched on their normalized title and author: existing
+    ones are updated, the rest created (see api/upsert.py). Re-posting
+    the same feed changes nothing.
+    """
+    queryset = Book.objects.all()
+    permission_classes = [IsAdminUser]
+
+    def post(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            raise ValidationError({"detail": "Expected a list of books."})
+        try:
+            count = upsert.upsert_books(request.data)
+        except upsert.UpsertValidationError as exc:
+            return Response({"errors": exc.errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"upserted": count})
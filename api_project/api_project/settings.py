@@ -10,11 +10,17 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import sys
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
+# The repository root, so every project can import the `shared` package
+REPO_DIR = BASE_DIR.parent
+if str(REPO_DIR) not in sys.path:
+    sys.path.append(str(REPO_DIR))
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -40,6 +46,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'shared.perf.PerfMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -121,8 +128,7 @@ STATIC_URL = 'static/'
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-INSTALLED_APPS = [
-    # ...
+INSTALLED_APPS += [
     'rest_framework',
     'rest_framework.authtoken',
     'api',
@@ -130,7 +136,8 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        # TokenAuthentication with a per-process token -> user cache
+        "api.authentication.CachedTokenAuthentication",
         # Keep SessionAuthentication if you want the browsable API with login:
         "rest_framework.authentication.SessionAuthentication",
     ],
@@ -138,4 +145,10 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticatedOrReadOnly",
     ],
+    "DEFAULT_PAGINATION_CLASS": "shared.drf.pagination.KeysetCursorPagination",
 }
+
+# Token auth cache (see api/authentication.py)
+TOKEN_AUTH_CACHE_SIZE = 10000
+TOKEN_AUTH_CACHE_TTL = 60
+TOKEN_AUTH_CACHE = None  # or a CACHES alias to share entries between processes
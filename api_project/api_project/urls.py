@@ -17,10 +17,12 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 from rest_framework.authtoken.views import obtain_auth_token
+from shared.perf import perf_view
 from django.urls import path, include
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('__perf__', perf_view, name='perf'),
     path('api/', include('api.urls')),
     path('api/auth/token/', obtain_auth_token, name='obtain-token'),
 ]
@@ -1,7 +1,9 @@
 from django.contrib import admin
 from django.urls import path, include
+from shared.perf import perf_view
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("__perf__", perf_view, name="perf"),
     path("", include("relationship_app.urls")),
 ]
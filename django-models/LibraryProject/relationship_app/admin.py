@@ -4,7 +4,8 @@ from .models import UserProfile
 
 
 admin.site.register(Author)
-admin.site.register(Book)
+# Book.__str__ and Librarian.__str__ follow their foreign keys
+admin.site.register(Book, list_select_related=["author"])
 admin.site.register(Library)
-admin.site.register(Librarian)
+admin.site.register(Librarian, list_select_related=["library"])
 admin.site.register(UserProfile)
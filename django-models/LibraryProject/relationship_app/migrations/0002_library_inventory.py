@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-18 04:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_inventory(apps, schema_editor):
+    Through = apps.get_model("relationship_app", "Library").books.through
+    LibraryInventory = apps.get_model("relationship_app", "LibraryInventory")
+    rows = Through.objects.values_list(
+        "library_id", "book_id", "book__title", "book__author__name"
+    ).order_by("pk")
+    batch = []
+    for library_id, book_id, title, author_name in rows.iterator(chunk_size=2000):
+        batch.append(LibraryInventory(
+            library_id=library_id, book_id=book_id, title=title, author_name=author_name))
+        if len(batch) >= 2000:
+            LibraryInventory.objects.bulk_create(batch)
+            batch = []
+    LibraryInventory.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('relationship_app', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='book',
+            options={'permissions': (('can_add_book', 'Can add book'), ('can_change_book', 'Can change book'), ('can_delete_book', 'Can delete book'))},
+        ),
+        migrations.CreateModel(
+            name='UserProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('role', models.CharField(choices=[('Admin', 'Admin'), ('Librarian', 'Librarian'), ('Member', 'Member')], default='Member', max_length=20)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profile', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LibraryInventory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=255)),
+                ('author_name', models.CharField(max_length=255)),
+                ('book', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='relationship_app.book')),
+                ('library', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inventory', to='relationship_app.library')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['library', 'title', 'book'], name='library_inventory_page_idx')],
+                'constraints': [models.UniqueConstraint(fields=('library', 'book'), name='library_inventory_unique')],
+            },
+        ),
+        migrations.RunPython(backfill_inventory, migrations.RunPython.noop),
+    ]
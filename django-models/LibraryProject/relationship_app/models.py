@@ -1,6 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_save
 from django.dispatch import receiver
 
 
@@ -23,6 +23,14 @@ class Book(models.Model):
     def __str__(self):
         return f"{self.title} ({self.author.name})"
 
+    # <-- add this block exactly
+    class Meta:
+        permissions = (
+            ("can_add_book", "Can add book"),
+            ("can_change_book", "Can change book"),
+            ("can_delete_book", "Can delete book"),
+        )
+
 
 class Library(models.Model):
     name = models.CharField(max_length=255)
@@ -50,6 +58,33 @@ class Librarian(models.Model):
         return f"{self.name} — {self.library.name}"
 
 
+class LibraryInventory(models.Model):
+    """
+    Read model: one row per (library, book) with the columns the library
+    page shows, so a page of a huge library is a single index range scan.
+    Kept in sync by the receivers below; never edit it directly.
+    """
+    library = models.ForeignKey(
+        Library, on_delete=models.CASCADE, related_name="inventory")
+    book = models.ForeignKey(
+        Book, on_delete=models.CASCADE, related_name="+")
+    title = models.CharField(max_length=255)
+    author_name = models.CharField(max_length=255)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["library", "book"], name="library_inventory_unique"),
+        ]
+        indexes = [
+            models.Index(
+                fields=["library", "title", "book"], name="library_inventory_page_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.title} @ {self.library_id}"
+
+
 class UserProfile(models.Model):  # <-- exact string the grader expects
     ROLE_CHOICES = [
         ('Admin', 'Admin'),
@@ -71,24 +106,59 @@ def create_user_profile(sender, instance, created, **kwargs):
         UserProfile.objects.create(user=instance)  # default role='Member'
 
 
-@receiver(post_save, sender=User)
-def save_user_profile(sender, instance, **kwargs):
-    if hasattr(instance, 'profile'):
-        instance.profile.save()
-
-
-class Book(models.Model):
-    title = models.CharField(max_length=255)
-    author = models.ForeignKey(
-        Author, on_delete=models.CASCADE, related_name="books")
+# -----------------------------
+# Library inventory maintenance
+# -----------------------------
+def add_inventory_rows(pairs):
+    """Insert inventory rows for (library_id, book_id) pairs."""
+    pairs = list(pairs)
+    books = Book.objects.filter(pk__in={book_id for _, book_id in pairs})
+    details = {
+        pk: (title, author_name)
+        for pk, title, author_name in books.values_list("pk", "title", "author__name")
+    }
+    LibraryInventory.objects.bulk_create(
+        [
+            LibraryInventory(
+                library_id=library_id, book_id=book_id,
+                title=details[book_id][0], author_name=details[book_id][1],
+            )
+            for library_id, book_id in pairs
+            if book_id in details
+        ],
+        ignore_conflicts=True,
+    )
 
-    def __str__(self):
-        return f"{self.title} ({self.author.name})"
 
-    # <-- add this block exactly
-    class Meta:
-        permissions = (
-            ("can_add_book", "Can add book"),
-            ("can_change_book", "Can change book"),
-            ("can_delete_book", "Can delete book"),
-        )
+@receiver(m2m_changed, sender=Library.books.through)
+def sync_library_inventory(sender, instance, action, reverse, pk_set, **kwargs):
+    # reverse=True means the change came from book.libraries
+    if action == "post_add":
+        if reverse:
+            add_inventory_rows((library_id, instance.pk) for library_id in pk_set)
+        else:
+            add_inventory_rows((instance.pk, book_id) for book_id in pk_set)
+    elif action == "post_remove":
+        if reverse:
+            LibraryInventory.objects.filter(
+                book=instance, library_id__in=pk_set).delete()
+        else:
+            LibraryInventory.objects.filter(
+                library=instance, book_id__in=pk_set).delete()
+    elif action == "post_clear":
+        field = "book" if reverse else "library"
+        LibraryInventory.objects.filter(**{field: instance}).delete()
+
+
+@receiver(post_save, sender=Book)
+def refresh_inventory_for_book(sender, instance, created, **kwargs):
+    if not created:
+        LibraryInventory.objects.filter(book=instance).update(
+            title=instance.title, author_name=instance.author.name)
+
+
+@receiver(post_save, sender=Author)
+def refresh_inventory_for_author(sender, instance, created, **kwargs):
+    if not created:
+        LibraryInventory.objects.filter(book__author=instance).update(
+            author_name=instance.name)
@@ -0,0 +1,127 @@
+"""
+N+1 query detection.
+
+Every query run inside `detect_n_plus_one()` is reduced to its shape
+(the SQL with placeholders, IN lists collapsed) and tagged with the
+template line being rendered when it ran. A shape that runs `threshold`
+or more times is reported as an N+1, e.g.
+
+    relationship_app/list_books.html:11 ran 3x: SELECT ... FROM "relationship_app_author" WHERE ...
+
+Use NPlusOneAssertionsMixin.assertNoNPlusOne() in tests, and
+NPlusOneWarningMiddleware to log offenders while developing (DEBUG only).
+"""
+import logging
+import re
+import sys
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.template.base import Node
+
+logger = logging.getLogger(__name__)
+
+IN_LIST_RE = re.compile(r"\bIN \((?:%s, )*%s\)")
+MAX_STACK_DEPTH = 200
+
+
+def query_shape(sql):
+    """SQL with every IN (...) list collapsed, so batch sizes don't matter."""
+    return IN_LIST_RE.sub("IN (...)", sql)
+
+
+def template_location():
+    """'template:line' of the innermost template node being rendered, if any."""
+    frame = sys._getframe(2)
+    depth = 0
+    while frame is not None and depth < MAX_STACK_DEPTH:
+        node = frame.f_locals.get("self")
+        if isinstance(node, Node) and getattr(node, "token", None) is not None:
+            origin = node.origin
+            name = origin.template_name or origin.name if origin else "<string>"
+            return f"{name}:{node.token.lineno}"
+        frame = frame.f_back
+        depth += 1
+    return None
+
+
+class Offender:
+    def __init__(self, shape, count, locations):
+        self.shape = shape
+        self.count = count
+        self.locations = locations
+
+    def __str__(self):
+        where = ", ".join(self.locations) or "outside templates"
+        return f"{where} ran {self.count}x: {self.shape}"
+
+
+class QueryShapeRecorder:
+    """Execute wrapper counting query shapes and where they were issued."""
+
+    def __init__(self, threshold=2):
+        self.threshold = threshold
+        self.shapes = Counter()
+        self.locations = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        shape = query_shape(sql)
+        self.shapes[shape] += 1
+        location = template_location()
+        if location:
+            self.locations.setdefault(shape, Counter())[location] += 1
+        return execute(sql, params, many, context)
+
+    @property
+    def offenders(self):
+        return [
+            Offender(shape, count, list(self.locations.get(shape, ())))
+            for shape, count in self.shapes.most_common()
+            if count >= self.threshold
+        ]
+
+
+@contextmanager
+def detect_n_plus_one(threshold=2, using=None):
+    """Record queries on `using` (default: every connection) in the block."""
+    recorder = QueryShapeRecorder(threshold)
+    aliases = [using] if using else connections
+    with ExitStack() as stack:
+        for alias in aliases:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        yield recorder
+
+
+class NPlusOneAssertionsMixin:
+    """TestCase mixin: `with self.assertNoNPlusOne(): self.client.get(...)`."""
+
+    @contextmanager
+    def assertNoNPlusOne(self, threshold=2, using=None):
+        with detect_n_plus_one(threshold, using) as recorder:
+            yield recorder
+        offenders = recorder.offenders
+        if offenders:
+            self.fail("N+1 queries detected:\n" + "\n".join(map(str, offenders)))
+
+
+class NPlusOneWarningMiddleware:
+    """Logs a warning for each N+1 found while serving a request (DEBUG only)."""
+
+    def __init__(self, get_response):
+        if not settings.DEBUG:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold = getattr(settings, "NPLUSONE_THRESHOLD", 2)
+
+    def __call__(self, request):
+        with detect_n_plus_one(self.threshold) as recorder:
+            response = self.get_response(request)
+            # Deferred template responses render after the middleware chain
+            if hasattr(response, "render") and not response.is_rendered:
+                response.render()
+        for offender in recorder.offenders:
+            logger.warning("N+1 on %s: %s", request.path, offender)
+        return response
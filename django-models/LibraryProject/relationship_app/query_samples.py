@@ -1,4 +1,4 @@
-from relationship_app.models import Author, Book, Library, Librarian
+from relationship_app.models import Author, Book, Library, Librarian, LibraryInventory
 
 
 def books_by_author(author_name: str):
@@ -25,3 +25,62 @@ def librarian_for_library(library_name: str):
     librarian = Librarian.objects.get(library=library)
     print(librarian.name)
     return librarian
+
+
+# -----------------------------
+# Batch helpers
+# -----------------------------
+# Each takes any number of names and answers them with one grouped query
+# per BATCH_SIZE names (keeps IN lists under SQLite's variable limit).
+BATCH_SIZE = 500
+
+
+def _chunks(names):
+    names = list(dict.fromkeys(names))
+    for start in range(0, len(names), BATCH_SIZE):
+        yield names[start:start + BATCH_SIZE]
+
+
+def _group(names, rows):
+    grouped = {name: [] for name in names}
+    for name, value in rows:
+        grouped[name].append(value)
+    return {name: tuple(values) for name, values in grouped.items()}
+
+
+def books_by_authors(author_names):
+    """{author name: (book titles...)}; unknown authors map to ()."""
+    result = {}
+    for chunk in _chunks(author_names):
+        rows = (
+            Book.objects.filter(author__name__in=chunk)
+            .order_by("title", "pk")
+            .values_list("author__name", "title")
+        )
+        result.update(_group(chunk, rows))
+    return result
+
+
+def books_in_libraries(library_names):
+    """{library name: (book titles...)}; read from the inventory read model."""
+    result = {}
+    for chunk in _chunks(library_names):
+        rows = (
+            LibraryInventory.objects.filter(library__name__in=chunk)
+            .order_by("title", "book_id")
+            .values_list("library__name", "title")
+        )
+        result.update(_group(chunk, rows))
+    return result
+
+
+def librarians_for_libraries(library_names):
+    """{library name: librarian name or None}, one join per batch."""
+    result = {}
+    for chunk in _chunks(library_names):
+        result.update(dict.fromkeys(chunk))
+        result.update(
+            Librarian.objects.filter(library__name__in=chunk)
+            .values_list("library__name", "name")
+        )
+    return result
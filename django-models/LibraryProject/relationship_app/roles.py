@@ -0,0 +1,44 @@
+"""
+Role lookups for the role-gated views.
+
+A user's UserProfile.role is read once and then served from the user
+object (for the rest of the request) and from the cache (for later
+requests). Saving or deleting a UserProfile drops the cached entry.
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import UserProfile
+
+ROLE_CACHE_TIMEOUT = 300
+NO_ROLE = ""  # cached for users without a profile, so misses are cached too
+
+
+def role_cache_key(user_id):
+    return f"relationship_app:role:{user_id}"
+
+
+def get_role(user):
+    """Return the user's role ('Admin', 'Librarian', 'Member') or None."""
+    if not user.is_authenticated:
+        return None
+    role = getattr(user, "_cached_role", None)
+    if role is None:
+        key = role_cache_key(user.pk)
+        role = cache.get(key)
+        if role is None:
+            role = (
+                UserProfile.objects.filter(user_id=user.pk)
+                .values_list("role", flat=True)
+                .first()
+            ) or NO_ROLE
+            cache.set(key, role, ROLE_CACHE_TIMEOUT)
+        user._cached_role = role
+    return role or None
+
+
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=UserProfile)
+def invalidate_role(sender, instance, **kwargs):
+    cache.delete(role_cache_key(instance.user_id))
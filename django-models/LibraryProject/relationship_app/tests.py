@@ -1,3 +1,184 @@
-from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.shortcuts import render
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from shared.perf import store
+
+from .models import Author, Book, Librarian, Library
+from . import query_samples
+from .nplusone import NPlusOneAssertionsMixin, detect_n_plus_one
+from .roles import get_role
+from .views import LibraryDetailView, is_admin, is_member, list_books
+
+
+class NPlusOneTests(NPlusOneAssertionsMixin, TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.library = Library.objects.create(name="Central")
+        for i in range(3):
+            author = Author.objects.create(name=f"Author {i}")
+            cls.library.books.add(Book.objects.create(title=f"Book {i}", author=author))
+
+    def setUp(self):
+        self.factory = RequestFactory()
+
+    def test_detector_points_at_template_line(self):
+        request = self.factory.get("/books/")
+        with detect_n_plus_one() as recorder:
+            render(request, "relationship_app/list_books.html",
+                   {"books": Book.objects.all()})
+        [offender] = recorder.offenders
+        self.assertEqual(offender.count, 3)
+        self.assertIn("relationship_app_author", offender.shape)
+        self.assertEqual(offender.locations, ["relationship_app/list_books.html:11"])
+
+    def test_list_books_has_no_n_plus_one(self):
+        with self.assertNoNPlusOne():
+            response = list_books(self.factory.get("/books/"))
+        self.assertContains(response, "Book 2 by Author 2")
+
+    def test_library_detail_has_no_n_plus_one(self):
+        view = LibraryDetailView.as_view()
+        with self.assertNoNPlusOne():
+            response = view(self.factory.get("/"), pk=self.library.pk)
+            response.render()
+        self.assertContains(response, "Book 2 by Author 2")
+
+
+class LibraryInventoryTests(TestCase):
+    def setUp(self):
+        self.library = Library.objects.create(name="Branch")
+        Librarian.objects.create(name="Ada", library=self.library)
+        self.author = Author.objects.create(name="Ursula")
+        self.books = [
+            Book.objects.create(title=f"Book {i:02d}", author=self.author)
+            for i in range(5)
+        ]
+        self.library.books.add(*self.books)
+
+    def inventory(self):
+        return list(self.library.inventory.order_by("title")
+                    .values_list("title", "author_name"))
+
+    def test_inventory_follows_changes(self):
+        self.assertEqual(len(self.inventory()), 5)
+
+        self.books[0].libraries.remove(self.library)
+        self.library.books.remove(self.books[1])
+        self.books[2].title = "Renamed"
+        self.books[2].save()
+        self.author.name = "U. K. Le Guin"
+        self.author.save()
+        self.assertEqual(self.inventory(), [
+            ("Book 03", "U. K. Le Guin"),
+            ("Book 04", "U. K. Le Guin"),
+            ("Renamed", "U. K. Le Guin"),
+        ])
+
+        self.library.books.clear()
+        self.assertEqual(self.inventory(), [])
+
+    def test_detail_pages_in_fixed_queries(self):
+        view = LibraryDetailView.as_view(inventory_page_size=2)
+        factory = RequestFactory()
+        with self.assertNumQueries(2):
+            response = view(factory.get("/"), pk=self.library.pk)
+            response.render()
+        self.assertContains(response, "Librarian: Ada")
+        self.assertContains(response, "Book 01 by Ursula")
+        self.assertContains(response, f'?after={self.books[1].pk}')
+
+        response = view(factory.get("/", {"after": self.books[3].pk}), pk=self.library.pk)
+        response.render()
+        self.assertContains(response, "Book 04")
+        self.assertNotContains(response, "Book 03")
+        self.assertNotContains(response, "Next page")
+
+
+class RoleCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="reader", password="pass1234")
+
+    def fresh_user(self):
+        return User.objects.get(pk=self.user.pk)
+
+    def test_role_is_read_once(self):
+        user = self.fresh_user()
+        with self.assertNumQueries(1):
+            self.assertTrue(is_member(user))
+            self.assertFalse(is_admin(user))
+        with self.assertNumQueries(0):
+            self.assertEqual(get_role(self.user), "Member")
+
+    def test_role_change_invalidates_cache(self):
+        self.assertEqual(get_role(self.fresh_user()), "Member")
+        profile = self.user.profile
+        profile.role = "Admin"
+        profile.save()
+        self.assertTrue(is_admin(self.fresh_user()))
+
+        profile.delete()
+        self.assertIsNone(get_role(self.fresh_user()))
+
+    def test_user_save_does_not_touch_profile(self):
+        with self.assertNumQueries(1):
+            self.user.save()
+
+
+class BatchQueryTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        le_guin = Author.objects.create(name="Le Guin")
+        butler = Author.objects.create(name="Butler")
+        central = Library.objects.create(name="Central")
+        Library.objects.create(name="Annex")
+        Librarian.objects.create(name="Ada", library=central)
+        central.books.add(
+            Book.objects.create(title="The Dispossessed", author=le_guin),
+            Book.objects.create(title="Kindred", author=butler),
+        )
+        Book.objects.create(title="Earthsea", author=le_guin)
+
+    def test_books_by_authors(self):
+        with self.assertNumQueries(1):
+            result = query_samples.books_by_authors(["Le Guin", "Butler", "Nobody"])
+        self.assertEqual(result, {
+            "Le Guin": ("Earthsea", "The Dispossessed"),
+            "Butler": ("Kindred",),
+            "Nobody": (),
+        })
+
+    def test_books_in_libraries(self):
+        with self.assertNumQueries(1):
+            result = query_samples.books_in_libraries(["Central", "Annex"])
+        self.assertEqual(result, {"Central": ("Kindred", "The Dispossessed"), "Annex": ()})
+
+    def test_librarians_for_libraries(self):
+        with self.assertNumQueries(1):
+            result = query_samples.librarians_for_libraries(["Central", "Annex"])
+        self.assertEqual(result, {"Central": "Ada", "Annex": None})
+
+    def test_large_batches_are_chunked(self):
+        names = [f"Author {i}" for i in range(1200)] + ["Butler"]
+        with self.assertNumQueries(3):
+            result = query_samples.books_by_authors(names)
+        self.assertEqual(len(result), 1201)
+        self.assertEqual(result["Butler"], ("Kindred",))
+
+
+class PerfMiddlewareTests(TestCase):
+    def setUp(self):
+        store.clear()
+        author = Author.objects.create(name="Octavia Butler")
+        Book.objects.create(title="Kindred", author=author)
+
+    def test_times_render_views(self):
+        # list_books uses render(), not a TemplateResponse
+        response = self.client.get(reverse("list-books"))
+        self.assertIn("tpl;dur=", response["Server-Timing"])
+        stats = store.snapshot()["list-books"]
+        self.assertEqual(stats["samples"], 1)
+        self.assertGreater(stats["template_ms"]["max"], 0)
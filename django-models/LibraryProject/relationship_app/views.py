@@ -1,7 +1,8 @@
 from django.shortcuts import render
 from django.views.generic.detail import DetailView
 from .models import Book
-from .models import Library
+from .models import Library, LibraryInventory
+from .roles import get_role
 from django.shortcuts import render, redirect
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth import login
@@ -9,6 +10,7 @@ from django.contrib.auth.decorators import login_required, user_passes_test
 from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from django.contrib.auth.decorators import permission_required
+from django.db.models import Q, Subquery
 
 
 @permission_required('relationship_app.can_add_book')
@@ -29,15 +31,15 @@ def delete_book(request, pk):
 
 
 def is_admin(user):
-    return user.is_authenticated and hasattr(user, "profile") and user.profile.role == "Admin"
+    return get_role(user) == "Admin"
 
 
 def is_librarian(user):
-    return user.is_authenticated and hasattr(user, "profile") and user.profile.role == "Librarian"
+    return get_role(user) == "Librarian"
 
 
 def is_member(user):
-    return user.is_authenticated and hasattr(user, "profile") and user.profile.role == "Member"
+    return get_role(user) == "Member"
 
 
 @login_required
@@ -60,7 +62,7 @@ def member_view(request):          # <-- function name is graded
 
 def list_books(request):
     # <-- checker looks for Book.objects.all()
-    books = Book.objects.all()
+    books = Book.objects.all().select_related("author")
     return render(request, "relationship_app/list_books.html", {"books": books})
 # Class-based view: library details + books
 
@@ -69,6 +71,27 @@ class LibraryDetailView(DetailView):
     model = Library
     template_name = "relationship_app/library_detail.html"
     context_object_name = "library"
+    queryset = Library.objects.select_related("librarian")
+    inventory_page_size = 50
+
+    def get_context_data(self, **kwargs):
+        # Books come from the inventory read model, one page at a time,
+        # resuming after the ?after=<book id> of the previous page.
+        context = super().get_context_data(**kwargs)
+        rows = LibraryInventory.objects.filter(library=self.object)
+        after = self.request.GET.get("after", "")
+        if after.isdigit():
+            last_title = LibraryInventory.objects.filter(
+                library=self.object, book_id=after).values("title")
+            rows = rows.filter(
+                Q(title__gt=Subquery(last_title))
+                | Q(title=Subquery(last_title), book_id__gt=after)
+            )
+        page = list(rows.order_by("title", "book_id")[: self.inventory_page_size + 1])
+        context["inventory"] = page[: self.inventory_page_size]
+        if len(page) > self.inventory_page_size:
+            context["next_after"] = page[self.inventory_page_size - 1].book_id
+        return context
 
 
 def register(request):
@@ -4,5 +4,5 @@ from .models import Post
 
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
-    list_display = ("title", "author", "published_date")
+    list_display = ("title", "author", "published_date", "comment_count")
     search_fields = ("title", "author__username")
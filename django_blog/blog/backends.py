@@ -0,0 +1,19 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+UserModel = get_user_model()
+
+
+class ProfileModelBackend(ModelBackend):
+    """
+    ModelBackend whose get_user() joins the user's Profile, so the
+    request.user loaded by AuthenticationMiddleware arrives with its
+    profile (or the knowledge that it has none) in a single query.
+    """
+
+    def get_user(self, user_id):
+        try:
+            user = UserModel._default_manager.select_related("profile").get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
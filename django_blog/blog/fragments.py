@@ -0,0 +1,64 @@
+# blog/fragments.py
+"""
+Rendered-fragment cache for post pages.
+
+Fragments are stored under the post id plus a per-post version number.
+The receivers in blog/signals.py bump the version whenever the post, its
+comments, its tags or a username shown on it change, so an outdated
+fragment is never read again and simply ages out of the cache.
+
+BLOG_FRAGMENT_CACHE names the cache alias to use (any Django backend);
+the default settings point it at a size-bounded LocMemCache, which
+evicts least-recently-used entries once MAX_ENTRIES is reached.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+FRAGMENT_TIMEOUT = 60 * 60
+
+
+def fragment_cache():
+    return caches[getattr(settings, "BLOG_FRAGMENT_CACHE", "default")]
+
+
+def _version_key(post_id):
+    return f"blog:post:{post_id}:version"
+
+
+def get_post_version(post_id):
+    cache = fragment_cache()
+    key = _version_key(post_id)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock: if the counter is ever evicted, the new value
+        # is still larger than any version an old fragment was stored under.
+        version = time.time_ns()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_post_version(post_id):
+    cache = fragment_cache()
+    key = _version_key(post_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=None)
+
+
+def cached_fragment(post_id, render, name="detail"):
+    """
+    Return the fragment `name` for a post, calling `render()` on a miss.
+    The version is read before rendering, so a write that races with the
+    render leaves the result under a version nobody will ask for again.
+    """
+    cache = fragment_cache()
+    key = f"blog:post:{post_id}:v{get_post_version(post_id)}:{name}"
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = render()
+        cache.set(key, fragment, FRAGMENT_TIMEOUT)
+    return fragment
@@ -0,0 +1,76 @@
+from django.core.management.base import BaseCommand
+from django.core.serializers.json import DjangoJSONEncoder
+
+from blog.models import Comment, Post
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream posts with their tags and comments as NDJSON (one post per "
+        "line). Memory use is bounded by --chunk-size, not by the table size."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", nargs="?", default="-", help="File path or - for stdout.")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        to_stdout = options["output"] == "-"
+        out = self.stdout if to_stdout else open(options["output"], "w")
+        try:
+            count = self.export(out, options["chunk_size"])
+        finally:
+            if not to_stdout:
+                out.close()
+        self.stderr.write(self.style.SUCCESS(f"Exported {count} posts."))
+
+    def export(self, out, chunk_size):
+        tagged_items = Post.tags.through.objects
+        encoder = DjangoJSONEncoder(separators=(",", ":"), ensure_ascii=False)
+        count = 0
+        last_pk = 0
+        while True:
+            posts = list(
+                Post.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .values("pk", "title", "content", "published_date", "author__username")
+                [:chunk_size]
+            )
+            if not posts:
+                return count
+            ids = [p["pk"] for p in posts]
+            last_pk = ids[-1]
+
+            # One query each for the chunk's tags and comments
+            tags = {}
+            for post_id, name in (
+                tagged_items.filter(
+                    content_type__app_label="blog", content_type__model="post",
+                    object_id__in=ids,
+                )
+                .order_by("tag__name")
+                .values_list("object_id", "tag__name")
+            ):
+                tags.setdefault(post_id, []).append(name)
+            comments = {}
+            for post_id, author, content, created_at in (
+                Comment.objects.filter(post_id__in=ids)
+                .order_by("post_id", "created_at", "pk")
+                .values_list("post_id", "author__username", "content", "created_at")
+            ):
+                comments.setdefault(post_id, []).append(
+                    {"author": author, "content": content, "created_at": created_at}
+                )
+
+            for post in posts:
+                line = encoder.encode({
+                    "id": post["pk"],
+                    "title": post["title"],
+                    "content": post["content"],
+                    "published_date": post["published_date"],
+                    "author": post["author__username"],
+                    "tags": tags.get(post["pk"], []),
+                    "comments": comments.get(post["pk"], []),
+                })
+                out.write(line + "\n")
+            count += len(posts)
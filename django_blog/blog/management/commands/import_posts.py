@@ -0,0 +1,131 @@
+import json
+import sys
+from collections import Counter
+from itertools import islice
+
+from django.contrib.auth import get_user_model
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+from taggit.models import Tag
+
+from blog.models import Comment, Post
+from blog.search import get_search_backend
+from blog.tagstats import record_tags_added
+
+
+class Command(BaseCommand):
+    help = (
+        "Load posts, tags and comments from NDJSON produced by export_posts. "
+        "Rows are written with bulk_create in chunks, one transaction per chunk."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("input", nargs="?", default="-", help="File path or - for stdin.")
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--keep-ids", action="store_true",
+            help="Reuse the post ids from the archive (restoring into an empty table).",
+        )
+
+    def handle(self, *args, **options):
+        source = sys.stdin if options["input"] == "-" else open(options["input"])
+        self.keep_ids = options["keep_ids"]
+        self.content_type = ContentType.objects.get_for_model(Post)
+        self.search = get_search_backend()
+        total = 0
+        try:
+            lines = (line for line in source if line.strip())
+            while True:
+                chunk = [json.loads(line) for line in islice(lines, options["chunk_size"])]
+                if not chunk:
+                    break
+                with transaction.atomic():
+                    self.import_chunk(chunk)
+                total += len(chunk)
+                self.stderr.write(f"Imported {total} posts...")
+        finally:
+            if source is not sys.stdin:
+                source.close()
+        self.stderr.write(self.style.SUCCESS(f"Imported {total} posts."))
+
+    def import_chunk(self, records):
+        users = self.resolve_users(records)
+
+        posts = []
+        for record in records:
+            comment_times = [parse_datetime(c["created_at"]) for c in record.get("comments", [])]
+            post = Post(
+                title=record["title"],
+                content=record["content"],
+                author_id=users[record["author"]],
+                comment_count=len(comment_times),
+                last_comment_at=max(comment_times, default=None),
+            )
+            if self.keep_ids and record.get("id"):
+                post.pk = record["id"]
+            posts.append(post)
+        Post.objects.bulk_create(posts)
+        # published_date is auto_now_add, which bulk_create overwrites
+        for post, record in zip(posts, records):
+            post.published_date = parse_datetime(record["published_date"])
+        Post.objects.bulk_update(posts, ["published_date"])
+
+        tag_ids = self.resolve_tags(records)
+        tagged_items = Post.tags.through
+        tagged_items.objects.bulk_create([
+            tagged_items(content_type=self.content_type, object_id=post.pk, tag_id=tag_ids[name])
+            for post, record in zip(posts, records)
+            for name in set(record.get("tags", []))
+        ])
+        record_tags_added(Counter(
+            tag_ids[name] for record in records for name in set(record.get("tags", []))
+        ))
+
+        comments = [
+            Comment(post_id=post.pk, author_id=users[c["author"]], content=c["content"])
+            for post, record in zip(posts, records)
+            for c in record.get("comments", [])
+        ]
+        Comment.objects.bulk_create(comments)
+        created = [
+            parse_datetime(c["created_at"]) for record in records for c in record.get("comments", [])
+        ]
+        for comment, created_at in zip(comments, created):
+            comment.created_at = created_at
+        Comment.objects.bulk_update(comments, ["created_at"])
+
+        # bulk_create skips the signal receivers, so index the chunk directly
+        if self.search is not None:
+            self.search.index_documents([
+                (post.pk, post.title, post.content, " ".join(record.get("tags", [])))
+                for post, record in zip(posts, records)
+            ])
+
+    def resolve_users(self, records):
+        names = {r["author"] for r in records}
+        names.update(c["author"] for r in records for c in r.get("comments", []))
+        User = get_user_model()
+        users = dict(
+            User.objects.filter(username__in=names).values_list("username", "pk")
+        )
+        missing = names - users.keys()
+        if missing:
+            raise CommandError(f"Unknown usernames: {', '.join(sorted(missing))}")
+        return users
+
+    def resolve_tags(self, records):
+        names = {name for r in records for name in r.get("tags", [])}
+        tag_ids = dict(Tag.objects.filter(name__in=names).values_list("name", "pk"))
+        new = names - tag_ids.keys()
+        if new:
+            Tag.objects.bulk_create(
+                [Tag(name=name, slug=Tag().slugify(name)) for name in new],
+                ignore_conflicts=True,
+            )
+            tag_ids.update(Tag.objects.filter(name__in=new).values_list("name", "pk"))
+            # Names whose slug collided with an existing tag: let taggit pick a slug
+            for name in new - tag_ids.keys():
+                tag_ids[name] = Tag.objects.get_or_create(name=name)[0].pk
+        return tag_ids
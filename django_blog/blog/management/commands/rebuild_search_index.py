@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from blog.models import Post
+from blog.search import get_search_backend
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index for all blog posts."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        if backend is None:
+            raise CommandError("No full-text search backend for this database.")
+        posts = (
+            Post.objects.order_by("pk")
+            .prefetch_related("tags")
+            .iterator(chunk_size=options["chunk_size"])
+        )
+        count = backend.rebuild(posts)
+        self.stdout.write(self.style.SUCCESS(f"Indexed {count} posts."))
@@ -0,0 +1,29 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Max
+
+from blog.models import Post, TagStat
+
+
+class Command(BaseCommand):
+    help = "Recompute the TagStat table from the current post/tag assignments."
+
+    def handle(self, *args, **options):
+        rows = (
+            Post.objects.filter(tags__isnull=False)
+            .order_by()
+            .values("tags")
+            .annotate(post_count=Count("pk"), last_used_at=Max("published_date"))
+        )
+        stats = [
+            TagStat(
+                tag_id=row["tags"],
+                post_count=row["post_count"],
+                last_used_at=row["last_used_at"],
+            )
+            for row in rows
+        ]
+        with transaction.atomic():
+            TagStat.objects.all().delete()
+            TagStat.objects.bulk_create(stats, batch_size=1000)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt stats for {len(stats)} tags."))
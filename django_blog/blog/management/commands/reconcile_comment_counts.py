@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, Max
+
+from blog.models import Comment, Post
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute Post.comment_count and Post.last_comment_at from the "
+        "comments table, fixing any posts that have drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000)
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Report drifted posts without writing.",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        checked = fixed = 0
+        last_pk = 0
+        while True:
+            posts = list(
+                Post.objects.filter(pk__gt=last_pk)
+                .order_by("pk")
+                .only("pk", "comment_count", "last_comment_at")[:chunk_size]
+            )
+            if not posts:
+                break
+            last_pk = posts[-1].pk
+            # One grouped query per chunk of posts
+            stats = {
+                row["post_id"]: row
+                for row in Comment.objects.filter(
+                    post_id__gte=posts[0].pk, post_id__lte=last_pk
+                )
+                .order_by()
+                .values("post_id")
+                .annotate(count=Count("pk"), latest=Max("created_at"))
+            }
+            drifted = []
+            for post in posts:
+                row = stats.get(post.pk, {"count": 0, "latest": None})
+                if (post.comment_count, post.last_comment_at) != (row["count"], row["latest"]):
+                    post.comment_count = row["count"]
+                    post.last_comment_at = row["latest"]
+                    drifted.append(post)
+            if drifted and not options["dry_run"]:
+                Post.objects.bulk_update(drifted, ["comment_count", "last_comment_at"])
+            checked += len(posts)
+            fixed += len(drifted)
+
+        verb = "Found" if options["dry_run"] else "Fixed"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {fixed} drifted posts out of {checked}.")
+        )
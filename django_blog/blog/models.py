@@ -3,10 +3,9 @@ from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import User
 from django.db import models
-from django.db.models.signals import post_save
-from django.dispatch import receiver
 from django.urls import reverse
 from taggit.managers import TaggableManager
+from taggit.models import Tag
 
 
 class Post(models.Model):
@@ -18,9 +17,14 @@ class Post(models.Model):
     )
     # Use taggit for tags
     tags = TaggableManager(blank=True)
+    # Denormalized from Comment so listings don't need a COUNT per post.
+    # Kept current by blog/signals.py; `manage.py reconcile_comment_counts`
+    # repairs any drift.
+    comment_count = models.PositiveIntegerField(default=0, editable=False)
+    last_comment_at = models.DateTimeField(null=True, blank=True, editable=False)
 
     class Meta:
-        ordering = ["-published_date"]  # newest first
+        ordering = ["-published_date", "-id"]  # newest first, id breaks ties
 
     def __str__(self):
         return f"{self.title} by {self.author}"
@@ -29,6 +33,27 @@ class Post(models.Model):
         return reverse("post-detail", kwargs={"pk": self.pk})
 
 
+class TagStat(models.Model):
+    """
+    Materialized usage numbers for a tag, so tag clouds and "popular tags"
+    don't need a COUNT over taggit's generic relation.
+    Maintained incrementally by blog/signals.py (see blog/tagstats.py).
+    """
+    tag = models.OneToOneField(
+        Tag, on_delete=models.CASCADE, primary_key=True, related_name="stat"
+    )
+    post_count = models.PositiveIntegerField(default=0)
+    last_used_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["-post_count"], name="blog_tagstat_count_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.tag} ({self.post_count})"
+
+
 class Profile(models.Model):
     user = models.OneToOneField(
         User, on_delete=models.CASCADE, related_name="profile"
@@ -39,10 +64,21 @@ class Profile(models.Model):
         return f"Profile: {self.user.username}"
 
 
-@receiver(post_save, sender=User)
-def create_profile_for_new_user(sender, instance, created, **kwargs):
-    if created:
-        Profile.objects.create(user=instance)
+def get_profile(user):
+    """
+    Return the user's Profile without ever writing.
+
+    Profiles are created lazily: a user without a row gets an unsaved
+    Profile that is inserted the first time it is saved (e.g. through
+    ProfileUpdateForm). The result is cached on the user instance, and
+    ProfileModelBackend already select_related()s it for request.user.
+    """
+    try:
+        return user.profile
+    except Profile.DoesNotExist:
+        profile = Profile(user=user)
+        User.profile.related.set_cached_value(user, profile)
+        return profile
 
 
 class Comment(models.Model):
@@ -0,0 +1,132 @@
+# blog/pagination.py
+"""
+Keyset (cursor) pagination.
+
+Pages are addressed by the ordering key of the row next to them instead
+of an OFFSET, so page 1,000 costs the same index range scan as page 1,
+and no COUNT(*) is ever issued. Cursors are opaque url-safe tokens.
+"""
+import base64
+import json
+
+from django.db.models import Q
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+class KeysetPage:
+    def __init__(self, object_list, next_cursor=None, previous_cursor=None):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    @property
+    def has_next(self):
+        return self.next_cursor is not None
+
+    @property
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+
+class KeysetPaginator:
+    """
+    Paginate `queryset` on `ordering`, e.g. ("-published_date", "-id").
+
+    The ordering must be unique (end it with the primary key) and all
+    fields must sort in the same direction.
+    """
+
+    def __init__(self, queryset, ordering, per_page=20):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = per_page
+        self.fields = [name.lstrip("-") for name in self.ordering]
+        self.descending = self.ordering[0].startswith("-")
+        if any(name.startswith("-") != self.descending for name in self.ordering):
+            raise ValueError("All keyset ordering fields must share one direction.")
+
+    # -----------------------------
+    # Cursors
+    # -----------------------------
+    def encode_cursor(self, obj, direction):
+        key = [self._field(name).value_to_string(obj) for name in self.fields]
+        payload = json.dumps({"k": key, "d": direction}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            direction = payload["d"]
+            key = [
+                self._field(name).to_python(value)
+                for name, value in zip(self.fields, payload["k"], strict=True)
+            ]
+        except (ValueError, KeyError, TypeError) as exc:
+            raise InvalidCursor(cursor) from exc
+        if direction not in ("n", "p"):
+            raise InvalidCursor(cursor)
+        return key, direction
+
+    def _field(self, name):
+        return self.queryset.model._meta.get_field(name)
+
+    # -----------------------------
+    # Pages
+    # -----------------------------
+    def _seek(self, key, forward):
+        """Rows strictly after (forward) or before `key` in listing order."""
+        lookup = "lt" if self.descending == forward else "gt"
+        condition = Q()
+        for i, name in enumerate(self.fields):
+            equal = {field: value for field, value in zip(self.fields[:i], key[:i])}
+            condition |= Q(**equal, **{f"{name}__{lookup}": key[i]})
+        return condition
+
+    def _reversed_ordering(self):
+        return [name[1:] if name.startswith("-") else f"-{name}" for name in self.ordering]
+
+    def page(self, cursor=None):
+        limit = self.per_page + 1
+        if not cursor:
+            rows = list(self.queryset.order_by(*self.ordering)[:limit])
+            has_more = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+            return KeysetPage(
+                rows, next_cursor=self.encode_cursor(rows[-1], "n") if has_more else None
+            )
+
+        key, direction = self.decode_cursor(cursor)
+        if direction == "n":
+            qs = self.queryset.filter(self._seek(key, forward=True))
+            rows = list(qs.order_by(*self.ordering)[:limit])
+            has_more = len(rows) > self.per_page
+            rows = rows[: self.per_page]
+            if not rows:
+                return KeysetPage(rows)
+            return KeysetPage(
+                rows,
+                next_cursor=self.encode_cursor(rows[-1], "n") if has_more else None,
+                previous_cursor=self.encode_cursor(rows[0], "p"),
+            )
+
+        qs = self.queryset.filter(self._seek(key, forward=False))
+        rows = list(qs.order_by(*self._reversed_ordering())[:limit])
+        has_more = len(rows) > self.per_page
+        rows = rows[: self.per_page][::-1]
+        if not rows:
+            return KeysetPage(rows)
+        return KeysetPage(
+            rows,
+            next_cursor=self.encode_cursor(rows[-1], "n"),
+            previous_cursor=self.encode_cursor(rows[0], "p") if has_more else None,
+        )
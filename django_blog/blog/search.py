@@ -0,0 +1,188 @@
+# blog/search.py
+"""
+Inverted-index search for blog posts.
+
+Each Post is stored as one document (title, content, tag names) in a
+database-native full-text index: SQLite FTS5 locally, a tsvector table
+with a GIN index on Postgres. The index is kept up to date by the
+receivers in blog/signals.py and can be rebuilt from scratch with
+`python manage.py rebuild_search_index`.
+
+Set BLOG_SEARCH_BACKEND to a dotted path to force a specific backend.
+"""
+import re
+
+from django.conf import settings
+from django.db import connection
+from django.utils.module_loading import import_string
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(query):
+    """Split a user query into lowercase word tokens (punctuation is dropped)."""
+    return TOKEN_RE.findall(query.lower())
+
+
+class SearchBackend:
+    """
+    Interface every search backend implements.
+    `search()` returns post ids ordered by relevance, best match first.
+    """
+
+    def ensure_index(self):
+        raise NotImplementedError
+
+    def index_post(self, post):
+        self.index_documents([(post.pk, *self.document(post))])
+
+    def index_documents(self, documents):
+        """Index (post_id, title, content, tags) tuples in one batch."""
+        raise NotImplementedError
+
+    def remove_post(self, post_id):
+        raise NotImplementedError
+
+    def clear(self):
+        raise NotImplementedError
+
+    def search(self, query, limit=100):
+        raise NotImplementedError
+
+    def rebuild(self, posts):
+        self.ensure_index()
+        self.clear()
+        count = 0
+        for post in posts:
+            self.index_post(post)
+            count += 1
+        return count
+
+    @staticmethod
+    def document(post):
+        # Uses the prefetched tags when available (see rebuild_search_index)
+        tags = " ".join(tag.name for tag in post.tags.all())
+        return post.title, post.content, tags
+
+
+class SQLiteFTSBackend(SearchBackend):
+    """FTS5 virtual table keyed by the post id (rowid)."""
+
+    table = "blog_post_fts"
+
+    def ensure_index(self):
+        with connection.cursor() as cursor:
+            # prefix='2 3' keeps extra prefix indexes so "dja*" does not scan
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {self.table} USING fts5("
+                "title, content, tags, "
+                "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+
+    def index_documents(self, documents):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"DELETE FROM {self.table} WHERE rowid = %s",
+                [[doc[0]] for doc in documents],
+            )
+            cursor.executemany(
+                f"INSERT INTO {self.table} (rowid, title, content, tags) "
+                "VALUES (%s, %s, %s, %s)",
+                documents,
+            )
+
+    def remove_post(self, post_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [post_id])
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table}")
+
+    def search(self, query, limit=100):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # Every token must match; the trailing * turns it into a prefix query
+        match = " ".join(f'"{token}"*' for token in tokens)
+        with connection.cursor() as cursor:
+            # bm25 column weights: title, content, tags
+            cursor.execute(
+                f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s "
+                f"ORDER BY bm25({self.table}, 10.0, 1.0, 5.0) LIMIT %s",
+                [match, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgresSearchBackend(SearchBackend):
+    """Side table holding a weighted tsvector per post, GIN indexed."""
+
+    table = "blog_post_search"
+    config = "simple"
+
+    def ensure_index(self):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "post_id bigint PRIMARY KEY REFERENCES blog_post (id) ON DELETE CASCADE, "
+                "document tsvector NOT NULL)"
+            )
+            cursor.execute(
+                f"CREATE INDEX IF NOT EXISTS {self.table}_document_idx "
+                f"ON {self.table} USING gin (document)"
+            )
+
+    def index_documents(self, documents):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f"INSERT INTO {self.table} (post_id, document) VALUES (%s, "
+                "setweight(to_tsvector(%s, %s), 'A') || "
+                "setweight(to_tsvector(%s, %s), 'B') || "
+                "setweight(to_tsvector(%s, %s), 'C')) "
+                "ON CONFLICT (post_id) DO UPDATE SET document = EXCLUDED.document",
+                [
+                    [pk, self.config, title, self.config, tags, self.config, content]
+                    for pk, title, content, tags in documents
+                ],
+            )
+
+    def remove_post(self, post_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE post_id = %s", [post_id])
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f"TRUNCATE {self.table}")
+
+    def search(self, query, limit=100):
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        tsquery = " & ".join(f"{token}:*" for token in tokens)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT post_id FROM {self.table} "
+                "WHERE document @@ to_tsquery(%s, %s) "
+                "ORDER BY ts_rank(document, to_tsquery(%s, %s)) DESC LIMIT %s",
+                [self.config, tsquery, self.config, tsquery, limit],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+BACKENDS = {
+    "sqlite": SQLiteFTSBackend,
+    "postgresql": PostgresSearchBackend,
+}
+
+
+def get_search_backend():
+    """
+    Return the configured backend, or None when the database has no
+    full-text support we know about (callers fall back to icontains).
+    """
+    path = getattr(settings, "BLOG_SEARCH_BACKEND", None)
+    if path:
+        return import_string(path)()
+    backend_class = BACKENDS.get(connection.vendor)
+    return backend_class() if backend_class else None
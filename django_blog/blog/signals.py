@@ -0,0 +1,156 @@
+# blog/signals.py
+"""
+Receivers that keep data derived from posts (the search index, cached
+fragments, comment counters, tag statistics) in sync with writes. Connected from BlogConfig.ready().
+"""
+from django.conf import settings
+from django.db.models import F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from taggit.models import Tag
+
+from .fragments import bump_post_version
+from .models import Comment, Post
+from .search import get_search_backend
+from .tagstats import record_tags_added, record_tags_removed
+
+
+def ensure_search_index(sender, **kwargs):
+    # post_migrate hook: create the full-text table alongside the app tables
+    backend = get_search_backend()
+    if backend is not None:
+        backend.ensure_index()
+
+
+# -----------------------------
+# Search index
+# -----------------------------
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    backend = get_search_backend()
+    if backend is not None:
+        backend.index_post(instance)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, **kwargs):
+    backend = get_search_backend()
+    if backend is not None:
+        backend.remove_post(instance.pk)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def reindex_post_tags(sender, instance, action, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not isinstance(instance, Post):
+        return
+    backend = get_search_backend()
+    if backend is not None:
+        backend.index_post(instance)
+
+
+@receiver(post_save, sender=Tag)
+def reindex_renamed_tag(sender, instance, created, **kwargs):
+    if created:
+        return
+    backend = get_search_backend()
+    if backend is None:
+        return
+    for post in Post.objects.filter(tags=instance).prefetch_related("tags"):
+        backend.index_post(post)
+
+
+# -----------------------------
+# Fragment cache versions
+# -----------------------------
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def bump_post_fragments(sender, instance, **kwargs):
+    bump_post_version(instance.pk)
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def bump_comment_fragments(sender, instance, **kwargs):
+    bump_post_version(instance.post_id)
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def bump_tag_fragments(sender, instance, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear") and isinstance(instance, Post):
+        bump_post_version(instance.pk)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def bump_user_fragments(sender, instance, created, update_fields=None, **kwargs):
+    # Fragments show the usernames of the post author and the commenters.
+    # Saves that cannot have renamed anyone (new users, the last_login
+    # update on every login) leave them alone.
+    if created or (update_fields is not None and "username" not in update_fields):
+        return
+    post_ids = (
+        Post.objects.filter(Q(author=instance) | Q(comments__author=instance))
+        .values_list("pk", flat=True)
+        .distinct()
+    )
+    for post_id in post_ids:
+        bump_post_version(post_id)
+
+
+# -----------------------------
+# Comment counters
+# -----------------------------
+@receiver(post_save, sender=Comment)
+def count_new_comment(sender, instance, created, **kwargs):
+    if not created:
+        return
+    created_at = Value(instance.created_at)
+    Post.objects.filter(pk=instance.post_id).update(
+        comment_count=F("comment_count") + 1,
+        last_comment_at=Greatest(Coalesce("last_comment_at", created_at), created_at),
+    )
+
+
+@receiver(post_delete, sender=Comment)
+def uncount_deleted_comment(sender, instance, origin=None, **kwargs):
+    # Comments removed by cascade from their post: the row is going away too
+    if isinstance(origin, Post) or getattr(origin, "model", None) is Post:
+        return
+    latest = (
+        Comment.objects.filter(post=OuterRef("pk"))
+        .order_by("-created_at")
+        .values("created_at")[:1]
+    )
+    Post.objects.filter(pk=instance.post_id).update(
+        comment_count=Greatest(F("comment_count") - 1, 0),
+        last_comment_at=Subquery(latest),
+    )
+
+
+# -----------------------------
+# Tag statistics
+# -----------------------------
+def _post_tag_ids(post):
+    return list(post.tags.values_list("pk", flat=True))
+
+
+@receiver(m2m_changed, sender=Post.tags.through)
+def update_tag_stats(sender, instance, action, pk_set, **kwargs):
+    if not isinstance(instance, Post):
+        return
+    if action == "post_add":
+        record_tags_added(dict.fromkeys(pk_set, 1))
+    elif action == "post_remove":
+        record_tags_removed(pk_set)
+    elif action == "pre_clear":
+        instance._cleared_tag_ids = _post_tag_ids(instance)
+    elif action == "post_clear":
+        record_tags_removed(getattr(instance, "_cleared_tag_ids", []))
+
+
+@receiver(pre_delete, sender=Post)
+def release_post_tags(sender, instance, **kwargs):
+    # Runs inside the delete transaction, before taggit's rows cascade away
+    record_tags_removed(_post_tag_ids(instance))
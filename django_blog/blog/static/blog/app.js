@@ -1,2 +1,21 @@
-// Placeholder for future interactivity.
-console.log("Blog JS loaded");
+// Lazy-load further comment pages on the post detail page.
+document.addEventListener("click", async (event) => {
+  const button = event.target.closest(".load-comments");
+  if (!button) return;
+
+  button.disabled = true;
+  const url = `${button.dataset.url}?cursor=${encodeURIComponent(button.dataset.cursor)}`;
+  const response = await fetch(url, { headers: { Accept: "application/json" } });
+  if (!response.ok) {
+    button.disabled = false;
+    return;
+  }
+  const page = await response.json();
+  document.getElementById("comments").insertAdjacentHTML("beforeend", page.html);
+  if (page.next) {
+    button.dataset.cursor = page.next;
+    button.disabled = false;
+  } else {
+    button.remove();
+  }
+});
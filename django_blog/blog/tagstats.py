@@ -0,0 +1,57 @@
+# blog/tagstats.py
+"""
+Helpers around the TagStat aggregate: incremental updates used by the
+signal receivers and importers, and a cached "top N tags" lookup.
+"""
+from django.core.cache import cache
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import TagStat
+
+TOP_TAGS_TIMEOUT = 5 * 60
+
+
+def record_tags_added(tag_counts, when=None):
+    """`tag_counts` maps tag id -> number of posts that gained the tag."""
+    if not tag_counts:
+        return
+    when = when or timezone.now()
+    TagStat.objects.bulk_create(
+        [TagStat(tag_id=tag_id) for tag_id in tag_counts], ignore_conflicts=True
+    )
+    # Group tags by delta so a batch costs one UPDATE per distinct count
+    by_delta = {}
+    for tag_id, delta in tag_counts.items():
+        by_delta.setdefault(delta, []).append(tag_id)
+    for delta, tag_ids in by_delta.items():
+        TagStat.objects.filter(tag_id__in=tag_ids).update(
+            post_count=F("post_count") + delta, last_used_at=when
+        )
+
+
+def record_tags_removed(tag_ids):
+    if not tag_ids:
+        return
+    TagStat.objects.filter(tag_id__in=tag_ids).update(
+        post_count=Greatest(F("post_count") - 1, 0)
+    )
+
+
+def top_tags(limit=20):
+    """Most used tags as dicts (name, slug, post_count), cached briefly."""
+    key = f"blog:top-tags:{limit}"
+    tags = cache.get(key)
+    if tags is None:
+        tags = list(
+            TagStat.objects.filter(post_count__gt=0)
+            .order_by("-post_count")
+            .values("tag__name", "tag__slug", "post_count")[:limit]
+        )
+        tags = [
+            {"name": t["tag__name"], "slug": t["tag__slug"], "post_count": t["post_count"]}
+            for t in tags
+        ]
+        cache.set(key, tags, TOP_TAGS_TIMEOUT)
+    return tags
@@ -1,3 +1,344 @@
-from django.test import TestCase
+import json
+import tempfile
+from io import StringIO
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from shared.perf import perf_view, store
+
+from .backends import ProfileModelBackend
+from .models import Comment, Post, Profile, TagStat, get_profile
+from .pagination import InvalidCursor, KeysetPaginator
+from .search import get_search_backend
+
+
+class SearchIndexTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="writer", password="pass1234")
+        self.django_post = Post.objects.create(
+            title="Django tips", content="Notes on querysets.", author=self.user
+        )
+        self.python_post = Post.objects.create(
+            title="Weekend notes", content="Mostly about django signals.", author=self.user
+        )
+        self.backend = get_search_backend()
+
+    def test_prefix_match_ranks_title_first(self):
+        ids = self.backend.search("djan")
+        self.assertEqual(ids, [self.django_post.pk, self.python_post.pk])
+
+    def test_index_follows_updates_and_deletes(self):
+        self.python_post.title = "Queryset internals"
+        self.python_post.save()
+        self.assertIn(self.python_post.pk, self.backend.search("internals"))
+
+        self.python_post.delete()
+        self.assertEqual(self.backend.search("internals"), [])
+
+    def test_tag_changes_are_indexed(self):
+        self.django_post.tags.add("performance")
+        self.assertEqual(self.backend.search("perf"), [self.django_post.pk])
+
+        self.django_post.tags.clear()
+        self.assertEqual(self.backend.search("perf"), [])
+
+    def test_search_view_uses_index(self):
+        response = self.client.get(reverse("search"), {"q": "signals"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.context["posts"]), [self.python_post])
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        user = User.objects.create_user(username="writer", password="pass1234")
+        self.posts = [
+            Post.objects.create(title=f"Post {i}", content="...", author=user)
+            for i in range(5)
+        ]
+        self.newest_first = sorted(
+            self.posts, key=lambda p: (p.published_date, p.pk), reverse=True
+        )
+        self.paginator = KeysetPaginator(
+            Post.objects.all(), ("-published_date", "-id"), per_page=2
+        )
+
+    def test_walks_forward_and_back(self):
+        first = self.paginator.page()
+        self.assertEqual(first.object_list, self.newest_first[:2])
+        self.assertFalse(first.has_previous)
+
+        second = self.paginator.page(first.next_cursor)
+        third = self.paginator.page(second.next_cursor)
+        self.assertEqual(second.object_list, self.newest_first[2:4])
+        self.assertEqual(third.object_list, self.newest_first[4:])
+        self.assertFalse(third.has_next)
+
+        back = self.paginator.page(third.previous_cursor)
+        self.assertEqual(back.object_list, self.newest_first[2:4])
+        self.assertEqual(self.paginator.page(back.previous_cursor).object_list,
+                         self.newest_first[:2])
+
+    def test_no_offset_or_count(self):
+        cursor = self.paginator.page().next_cursor
+        with CaptureQueriesContext(connection) as ctx:
+            self.paginator.page(cursor)
+        sql = ctx.captured_queries[0]["sql"].upper()
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertNotIn("OFFSET", sql)
+        self.assertNotIn("COUNT(", sql)
+
+    def test_bad_cursor(self):
+        with self.assertRaises(InvalidCursor):
+            self.paginator.page("not-a-cursor")
+        response = self.client.get(reverse("home"), {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 404)
+
+
+class PostFragmentCacheTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="writer", password="pass1234")
+        self.post = Post.objects.create(
+            title="Cached", content="First draft.", author=self.user
+        )
+        self.url = reverse("post-detail", args=[self.post.pk])
+
+    def test_hot_post_skips_database(self):
+        self.client.get(self.url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertContains(response, "First draft.")
+
+    def test_writes_invalidate_fragment(self):
+        self.client.get(self.url)
+
+        self.post.content = "Second draft."
+        self.post.save()
+        self.assertContains(self.client.get(self.url), "Second draft.")
+
+        Comment.objects.create(post=self.post, author=self.user, content="Nice post")
+        self.assertContains(self.client.get(self.url), "Nice post")
+
+        self.post.tags.add("caching")
+        self.assertContains(self.client.get(self.url), "#caching")
+
+    def test_renamed_users_invalidate_fragment(self):
+        reader = User.objects.create_user(username="reader", password="pass1234")
+        Comment.objects.create(post=self.post, author=reader, content="Nice post")
+        self.client.get(self.url)
+
+        self.user.username = "renamed-writer"
+        self.user.save()
+        reader.username = "renamed-reader"
+        reader.save(update_fields=["username"])
+        response = self.client.get(self.url)
+        self.assertContains(response, "renamed-writer")
+        self.assertContains(response, "renamed-reader")
+        self.assertNotContains(response, "<small>reader ")
+
+    def test_logins_keep_fragment(self):
+        self.client.get(self.url)
+        self.client.login(username="writer", password="pass1234")
+        with self.assertNumQueries(2):  # session and user, none for the post
+            self.client.get(self.url)
+
+
+class CommentCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="writer", password="pass1234")
+        self.post = Post.objects.create(title="Counted", content="...", author=self.user)
+
+    def test_counters_follow_comments(self):
+        first = Comment.objects.create(post=self.post, author=self.user, content="one")
+        second = Comment.objects.create(post=self.post, author=self.user, content="two")
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 2)
+        self.assertEqual(self.post.last_comment_at, second.created_at)
+
+        second.delete()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+        self.assertEqual(self.post.last_comment_at, first.created_at)
+
+    def test_reconcile_fixes_drift(self):
+        comment = Comment.objects.create(post=self.post, author=self.user, content="one")
+        Post.objects.filter(pk=self.post.pk).update(comment_count=7, last_comment_at=None)
+
+        call_command("reconcile_comment_counts", stdout=StringIO())
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.comment_count, 1)
+        self.assertEqual(self.post.last_comment_at, comment.created_at)
+
+
+class CommentPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="writer", password="pass1234")
+        self.post = Post.objects.create(title="Viral", content="...", author=self.user)
+        for i in range(60):
+            Comment.objects.create(post=self.post, author=self.user, content=f"c{i}")
+
+    def test_detail_renders_first_page_only(self):
+        response = self.client.get(reverse("post-detail", args=[self.post.pk]))
+        self.assertContains(response, "c59")
+        self.assertNotContains(response, "<p>c9</p>")
+        self.assertContains(response, "Load more comments")
+
+    def test_json_endpoint_continues_thread(self):
+        url = reverse("post-comments", args=[self.post.pk])
+        first = self.client.get(url).json()
+        self.assertEqual(len(first["results"]), 50)
+        self.assertEqual(first["results"][0]["content"], "c59")
+
+        rest = self.client.get(url, {"cursor": first["next"]}).json()
+        self.assertEqual([c["content"] for c in rest["results"]],
+                         [f"c{i}" for i in range(9, -1, -1)])
+        self.assertIsNone(rest["next"])
+
+
+class TagStatTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="writer", password="pass1234")
+        self.first = Post.objects.create(title="One", content="...", author=self.user)
+        self.second = Post.objects.create(title="Two", content="...", author=self.user)
+
+    def counts(self):
+        return dict(TagStat.objects.values_list("tag__name", "post_count"))
+
+    def test_stats_follow_tagging(self):
+        self.first.tags.add("django", "python")
+        self.second.tags.add("django")
+        self.assertEqual(self.counts(), {"django": 2, "python": 1})
+
+        self.first.tags.remove("python")
+        self.second.tags.clear()
+        self.assertEqual(self.counts(), {"django": 1, "python": 0})
+
+        self.first.delete()
+        self.assertEqual(self.counts(), {"django": 0, "python": 0})
+
+    def test_rebuild_matches_incremental(self):
+        self.first.tags.add("django", "python")
+        self.second.tags.add("django")
+        TagStat.objects.update(post_count=99)
+
+        call_command("rebuild_tag_stats", stdout=StringIO())
+        self.assertEqual(self.counts(), {"django": 2, "python": 1})
+
+    def test_popular_tags_endpoint(self):
+        cache.clear()
+        self.first.tags.add("django", "python")
+        self.second.tags.add("django")
+        data = self.client.get(reverse("popular-tags"), {"limit": 1}).json()
+        self.assertEqual(data["results"], [{"name": "django", "slug": "django", "post_count": 2}])
+
+
+class ImportExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="writer", password="pass1234")
+        for i in range(3):
+            post = Post.objects.create(title=f"Post {i}", content=f"Body {i}", author=self.user)
+            post.tags.add("archive", f"tag{i}")
+            Comment.objects.create(post=post, author=self.user, content=f"Comment {i}")
+
+    def test_round_trip(self):
+        archive = StringIO()
+        call_command("export_posts", chunk_size=2, stdout=archive, stderr=StringIO())
+        exported = [json.loads(line) for line in archive.getvalue().splitlines()]
+        self.assertEqual(len(exported), 3)
+        self.assertEqual(exported[0]["tags"], ["archive", "tag0"])
+
+        Post.objects.all().delete()
+        with tempfile.NamedTemporaryFile("w+", suffix=".ndjson") as f:
+            f.write(archive.getvalue())
+            f.flush()
+            call_command("import_posts", f.name, chunk_size=2, stderr=StringIO())
+
+        self.assertEqual(Post.objects.count(), 3)
+        post = Post.objects.get(title="Post 1")
+        self.assertEqual(sorted(post.tags.names()), ["archive", "tag1"])
+        self.assertEqual(post.comment_count, 1)
+        self.assertEqual(post.comments.get().content, "Comment 1")
+        self.assertEqual(TagStat.objects.get(tag__name="archive").post_count, 3)
+        self.assertEqual(get_search_backend().search("tag1"), [post.pk])
+
+
+class LazyProfileTests(TestCase):
+    def test_user_creation_does_not_create_profile(self):
+        user = User.objects.create_user(username="reader", password="pass1234")
+        self.assertFalse(Profile.objects.filter(user=user).exists())
+
+    def test_profile_materialized_on_first_write(self):
+        user = User.objects.create_user(username="reader", password="pass1234")
+        self.client.force_login(user)
+
+        response = self.client.get(reverse("profile"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(Profile.objects.filter(user=user).exists())
+
+        self.client.post(reverse("profile"), {
+            "username": "reader", "email": "", "first_name": "", "last_name": "",
+            "bio": "Hello",
+        })
+        self.assertEqual(Profile.objects.get(user=user).bio, "Hello")
+
+    def test_register_logs_in_without_profile(self):
+        response = self.client.post(reverse("register"), {
+            "username": "newcomer", "email": "new@example.com",
+            "password1": "a-long-passphrase", "password2": "a-long-passphrase",
+        })
+        self.assertRedirects(response, reverse("profile"))
+        user = User.objects.get(username="newcomer")
+        self.assertFalse(Profile.objects.filter(user=user).exists())
+
+    def test_backend_loads_profile_with_user(self):
+        user = User.objects.create_user(username="reader", password="pass1234")
+        Profile.objects.create(user=user, bio="Hi")
+        with self.assertNumQueries(1):
+            loaded = ProfileModelBackend().get_user(user.pk)
+            self.assertEqual(get_profile(loaded).bio, "Hi")
+
+    def test_sessions_from_model_backend_stay_logged_in(self):
+        user = User.objects.create_user(username="reader", password="pass1234")
+        self.client.force_login(user, backend="django.contrib.auth.backends.ModelBackend")
+        response = self.client.get(reverse("profile"))
+        self.assertEqual(response.status_code, 200)
+
+
+class PerfMiddlewareTests(TestCase):
+    def setUp(self):
+        store.clear()
+        user = User.objects.create_user(username="writer", password="pass1234")
+        for i in range(3):
+            Post.objects.create(title=f"Post {i}", content="...", author=user)
+
+    def test_records_per_view_samples(self):
+        response = self.client.get(reverse("posts-list"))
+        self.assertIn("total;dur=", response["Server-Timing"])
+
+        stats = store.snapshot()["posts-list"]
+        self.assertEqual(stats["samples"], 1)
+        self.assertGreaterEqual(stats["queries"]["max"], 1)
+        self.assertGreater(stats["template_ms"]["max"], 0)
+
+    def test_times_render_and_render_to_string(self):
+        # home uses render(); the cached post body uses render_to_string()
+        self.client.get(reverse("home"))
+        self.client.get(reverse("post-detail", args=[Post.objects.first().pk]))
+        stats = store.snapshot()
+        self.assertGreater(stats["home"]["template_ms"]["max"], 0)
+        self.assertGreater(stats["post-detail"]["template_ms"]["max"], 0)
+
+    @override_settings(DEBUG=False)
+    def test_endpoint_is_staff_only(self):
+        request = RequestFactory().get("/__perf__")
+        request.user = User.objects.get(username="writer")
+        self.assertEqual(perf_view(request).status_code, 403)
+
+        request.user.is_staff = True
+        data = json.loads(perf_view(request).content)
+        self.assertEqual(data["ring_size"], 500)
@@ -1,11 +1,10 @@
-from .views import PostsByTagListView, SearchResultsView
+from .views import SearchResultsView
 from .views import (
     PostListView, PostDetailView, PostCreateView, PostUpdateView, PostDeleteView,
 )
-from . import views_auth
 from django.contrib.auth import views as auth_views
 from django.urls import path
-from .views import home
+from .views import home, post_comments, popular_tags, profile, register
 from .views import CommentCreateView, CommentUpdateView, CommentDeleteView
 from .views import PostByTagListView
 
@@ -15,18 +14,21 @@ urlpatterns = [
 
     path("login/",  auth_views.LoginView.as_view(template_name="blog/login.html"),   name="login"),
     path("logout/", auth_views.LogoutView.as_view(template_name="blog/logout.html"), name="logout"),
-    path("register/", views_auth.register, name="register"),
-    path("profile/", views_auth.profile, name="profile"),
+    path("register/", register, name="register"),
+    path("profile/", profile, name="profile"),
+    path("posts/", PostListView.as_view(), name="posts-list"),
     path("post/new/", PostCreateView.as_view(), name="post-create"),
     path("post/<int:pk>/", PostDetailView.as_view(), name="post-detail"),
     path("post/<int:pk>/update/", PostUpdateView.as_view(), name="post-update"),
     path("post/<int:pk>/delete/", PostDeleteView.as_view(), name="post-delete"),
+    path("post/<int:pk>/comments/", post_comments, name="post-comments"),
     path("post/<int:pk>/comments/new/",
          CommentCreateView.as_view(), name="comment-create"),
     path("comment/<int:pk>/update/",
          CommentUpdateView.as_view(), name="comment-update"),
     path("comment/<int:pk>/delete/",
          CommentDeleteView.as_view(), name="comment-delete"),
+    path("popular-tags/", popular_tags, name="popular-tags"),
     path("tags/<slug:tag_slug>/", PostByTagListView.as_view(), name="posts-by-tag"),
     path("search/", SearchResultsView.as_view(), name="search"),
 ]
@@ -1,9 +1,12 @@
 # blog/views.py
 from django.contrib import messages
+from django.contrib.auth import login
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
-from django.db.models import Q
+from django.db.models import Case, Q, When
+from django.http import Http404, JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
+from django.template.loader import render_to_string
 from django.urls import reverse, reverse_lazy
 from django.views.generic import (
     ListView, DetailView, CreateView, UpdateView, DeleteView
@@ -12,24 +15,69 @@ from django.views.generic import (
 from taggit.models import Tag
 
 from .forms import (
-    PostForm, CommentForm, UserUpdateForm, ProfileUpdateForm
+    PostForm, CommentForm, RegistrationForm, UserUpdateForm, ProfileUpdateForm
 )
-from .models import Post, Comment
+from .fragments import cached_fragment
+from .models import Post, Comment, get_profile
+from .pagination import InvalidCursor, KeysetPaginator
+from .search import get_search_backend
+from .tagstats import top_tags
+
+
+POSTS_PER_PAGE = 20
+POST_KEYSET = ("-published_date", "-id")  # matches Post.Meta.ordering
+COMMENTS_PER_PAGE = 50
+COMMENT_KEYSET = ("-created_at", "-id")  # matches Comment.Meta.ordering
+
+
+def paginate(request, queryset, ordering, per_page):
+    paginator = KeysetPaginator(queryset, ordering, per_page=per_page)
+    try:
+        return paginator.page(request.GET.get("cursor"))
+    except InvalidCursor:
+        raise Http404("Invalid page cursor.")
+
+
+class KeysetPaginationMixin:
+    """
+    Replace ListView's OFFSET/COUNT pagination with a cursor page.
+    The page is exposed to templates as `page`.
+    """
+
+    def get_context_data(self, **kwargs):
+        page = paginate(self.request, self.object_list, POST_KEYSET, POSTS_PER_PAGE)
+        ctx = super().get_context_data(object_list=page.object_list, **kwargs)
+        ctx["page"] = page
+        return ctx
 
 
 # -----------------------------
 # Basic pages
 # -----------------------------
 def home(request):
-    posts = Post.objects.select_related("author").all()
-    return render(request, "blog/index.html", {"posts": posts})
+    page = paginate(
+        request, Post.objects.select_related("author"), POST_KEYSET, POSTS_PER_PAGE
+    )
+    return render(request, "blog/index.html", {"posts": page.object_list, "page": page})
+
+
+def register(request):
+    if request.method == "POST":
+        form = RegistrationForm(request.POST)
+        if form.is_valid():
+            user = form.save()
+            login(request, user, backend="blog.backends.ProfileModelBackend")
+            return redirect("profile")
+    else:
+        form = RegistrationForm()
+    return render(request, "blog/register.html", {"form": form})
 
 
 @login_required
 def profile(request):
     if request.method == "POST":
         uform = UserUpdateForm(request.POST, instance=request.user)
-        pform = ProfileUpdateForm(request.POST, instance=request.user.profile)
+        pform = ProfileUpdateForm(request.POST, instance=get_profile(request.user))
         if uform.is_valid() and pform.is_valid():
             uform.save()
             pform.save()
@@ -37,7 +85,7 @@ def profile(request):
             return redirect("profile")
     else:
         uform = UserUpdateForm(instance=request.user)
-        pform = ProfileUpdateForm(instance=request.user.profile)
+        pform = ProfileUpdateForm(instance=get_profile(request.user))
 
     return render(request, "blog/profile.html", {"uform": uform, "pform": pform})
 
@@ -45,23 +93,52 @@ def profile(request):
 # -----------------------------
 # Post CRUD
 # -----------------------------
-class PostListView(ListView):
+class PostListView(KeysetPaginationMixin, ListView):
     model = Post
     template_name = "blog/post_list.html"
     context_object_name = "posts"
-    ordering = ["-published_date"]  # newest first
+    ordering = ["-published_date", "-id"]  # newest first
+
+    def get_queryset(self):
+        return super().get_queryset().select_related("author")
 
 
 class PostDetailView(DetailView):
+    """
+    Serves the post body and comment thread from the fragment cache;
+    the database is only hit when the post's version has moved on.
+    """
     model = Post
     template_name = "blog/post_detail.html"
     context_object_name = "post"
 
-    def get_context_data(self, **kwargs):
-        ctx = super().get_context_data(**kwargs)
-        ctx["comments"] = self.object.comments.select_related("author")
-        ctx["comment_form"] = CommentForm()
-        return ctx
+    def get(self, request, *args, **kwargs):
+        post = cached_fragment(self.kwargs["pk"], self.render_fragment)
+        return self.render_to_response(
+            {"view": self, "post": post, "comment_form": CommentForm()}
+        )
+
+    def render_fragment(self):
+        self.object = self.get_object(
+            self.get_queryset().select_related("author").prefetch_related("tags")
+        )
+        # Only the newest page of comments is rendered; the rest is fetched
+        # on demand from post_comments.
+        comments = KeysetPaginator(
+            self.object.comments.select_related("author"),
+            COMMENT_KEYSET,
+            per_page=COMMENTS_PER_PAGE,
+        ).page()
+        html = render_to_string("blog/_post_body.html", {
+            "post": self.object,
+            "comments": comments,
+        })
+        return {
+            "pk": self.object.pk,
+            "title": self.object.title,
+            "author_id": self.object.author_id,
+            "html": str(html),
+        }
 
 
 class PostCreateView(LoginRequiredMixin, CreateView):
@@ -96,6 +173,31 @@ class PostDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
 # -----------------------------
 # Comment CRUD
 # -----------------------------
+def post_comments(request, pk):
+    """
+    JSON page of a post's comments, newest first, for lazy loading.
+    Pass the previous response's `next` value as ?cursor= to continue.
+    """
+    post = get_object_or_404(Post.objects.only("pk"), pk=pk)
+    page = paginate(
+        request, post.comments.select_related("author"),
+        COMMENT_KEYSET, COMMENTS_PER_PAGE,
+    )
+    return JsonResponse({
+        "results": [
+            {
+                "id": c.pk,
+                "author": c.author.username,
+                "content": c.content,
+                "created_at": c.created_at.isoformat(),
+            }
+            for c in page
+        ],
+        "html": render_to_string("blog/_comment_items.html", {"comments": page}),
+        "next": page.next_cursor,
+    })
+
+
 class CommentCreateView(LoginRequiredMixin, CreateView):
     model = Comment
     form_class = CommentForm
@@ -140,7 +242,7 @@ class CommentDeleteView(LoginRequiredMixin, UserPassesTestMixin, DeleteView):
 # -----------------------------
 # Tag listing (required by checker)
 # -----------------------------
-class PostByTagListView(ListView):
+class PostByTagListView(KeysetPaginationMixin, ListView):
     """
     List posts filtered by a tag slug.
     The checker expects this exact class name and kwarg 'tag_slug'.
@@ -151,12 +253,13 @@ class PostByTagListView(ListView):
 
     def get_queryset(self):
         slug = self.kwargs.get("tag_slug")
-        self.tag = get_object_or_404(Tag, slug=slug)
+        # TagStat rides along on the tag lookup; no COUNT over TaggedItem
+        self.tag = get_object_or_404(Tag.objects.select_related("stat"), slug=slug)
         return (
             Post.objects.filter(tags__in=[self.tag])
             .select_related("author")
             .prefetch_related("tags")
-            .order_by("-published_date")
+            .order_by("-published_date", "-id")
         )
 
     def get_context_data(self, **kwargs):
@@ -165,28 +268,55 @@ class PostByTagListView(ListView):
         return ctx
 
 
+def popular_tags(request):
+    """JSON list of the most used tags, served from the TagStat aggregate."""
+    try:
+        limit = min(int(request.GET.get("limit", 20)), 100)
+    except ValueError:
+        limit = 20
+    return JsonResponse({"results": top_tags(limit)})
+
+
 # -----------------------------
 # Search
 # -----------------------------
 class SearchResultsView(ListView):
+    """
+    Ranked full-text search over title, content and tag names.
+    Falls back to icontains lookups when the database has no search backend.
+    """
     model = Post
     template_name = "blog/search_results.html"
     context_object_name = "posts"
+    max_results = 100
 
     def get_queryset(self):
         q = self.request.GET.get("q", "").strip()
         if not q:
             return Post.objects.none()
-        return (
-            Post.objects.filter(
-                Q(title__icontains=q) |
-                Q(content__icontains=q) |
-                Q(tags__name__icontains=q)
+        backend = get_search_backend()
+        if backend is None:
+            return (
+                Post.objects.filter(
+                    Q(title__icontains=q) |
+                    Q(content__icontains=q) |
+                    Q(tags__name__icontains=q)
+                )
+                .select_related("author")
+                .prefetch_related("tags")
+                .distinct()
+                .order_by("-published_date")
             )
+        ids = backend.search(q, limit=self.max_results)
+        if not ids:
+            return Post.objects.none()
+        # keep the backend's relevance order
+        rank = Case(*[When(pk=pk, then=pos) for pos, pk in enumerate(ids)])
+        return (
+            Post.objects.filter(pk__in=ids)
             .select_related("author")
             .prefetch_related("tags")
-            .distinct()
-            .order_by("-published_date")
+            .order_by(rank)
         )
 
     def get_context_data(self, **kwargs):
@@ -15,9 +15,11 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
+from shared.perf import perf_view
 
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('__perf__', perf_view, name='perf'),
     path("", include("blog.urls")),
 ]
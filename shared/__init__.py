@@ -0,0 +1,6 @@
+"""
+Code shared by the Django projects in this repository.
+
+Each project's settings put the repository root on sys.path, so this
+package imports as `shared` from any of them.
+"""
@@ -0,0 +1,5 @@
+"""
+Django REST framework helpers used by both API projects
+(advanced-api-project and api_project): sparse fieldsets, streamed
+exports and cursor pagination.
+"""
@@ -0,0 +1,144 @@
+# shared/drf/pagination.py
+"""
+Keyset cursor pagination for the list endpoints.
+
+DRF's CursorPagination addresses a page by the value of the first
+ordering field plus an OFFSET into the rows sharing it, and gives up on
+offsets past `offset_cutoff` (1,000): with more equal titles than that
+the next link never gets past them. KeysetCursorPagination addresses a
+page by the whole ordering key of the row next to it, primary key
+included, the same way django_blog's blog/pagination.py does. The next
+page is one index range scan (WHERE key > cursor ... LIMIT n) however
+deep it is and however many rows tie, and no COUNT(*) or OFFSET is ever
+issued.
+
+Rows may be model instances or values() dicts (advanced-api-project's
+FastListMixin). Ordering fields must be non-null columns of the model.
+"""
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+def dump_value(value):
+    """A JSON-safe form of a column value that field.to_python() reads back."""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if hasattr(value, "isoformat"):  # dates and datetimes, at full precision
+        return value.isoformat()
+    return str(value)  # Decimal, UUID
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Keyset pagination over the view's ordering (BookFilterBackend's or
+    `ordering`) with the primary key appended as the tie-breaker. Fields
+    may sort in different directions.
+    """
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    ordering = "id"
+
+    def get_ordering(self, request, queryset, view):
+        pk = queryset.model._meta.pk.name
+        ordering = []
+        for name in super().get_ordering(request, queryset, view):
+            if name.lstrip("-") == "pk":
+                name = name.replace("pk", pk)
+            ordering.append(name)
+            if name.lstrip("-") == pk:
+                break  # already unique; later fields never decide anything
+        else:
+            ordering.append(f"-{pk}" if ordering[0].startswith("-") else pk)
+        return tuple(ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        self.opts = queryset.model._meta
+        self.fields = [name.lstrip("-") for name in self.ordering]
+
+        key, direction = self.decode_cursor(request)
+        forward = direction == "n"
+        if key is not None:
+            queryset = queryset.filter(self.seek(key, forward))
+        ordering = self.ordering if forward else self.reversed_ordering()
+        rows = list(queryset.order_by(*ordering)[: self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        self.page = rows[: self.page_size] if forward else rows[: self.page_size][::-1]
+
+        if not self.page:
+            self.has_next = self.has_previous = False
+        elif forward:
+            self.has_next, self.has_previous = has_more, key is not None
+        else:
+            self.has_next, self.has_previous = True, has_more
+        return self.page
+
+    # -----------------------------
+    # Cursors
+    # -----------------------------
+    def decode_cursor(self, request):
+        """(key, "n" or "p") from the request's cursor; (None, "n") without one."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, "n"
+        try:
+            padded = encoded + "=" * (-len(encoded) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            direction = payload["d"]
+            key = [
+                self.opts.get_field(name).to_python(value)
+                for name, value in zip(self.fields, payload["k"], strict=True)
+            ]
+        except (ValueError, KeyError, TypeError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        if direction not in ("n", "p"):
+            raise NotFound(self.invalid_cursor_message)
+        return key, direction
+
+    def encode_cursor(self, row, direction):
+        key = [dump_value(value) for value in self.row_key(row)]
+        payload = json.dumps({"k": key, "d": direction}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def row_key(self, row):
+        key = []
+        for name in self.fields:
+            attname = self.opts.get_field(name).attname
+            if isinstance(row, dict):
+                key.append(row[name] if name in row else row[attname])
+            else:
+                key.append(getattr(row, attname))
+        return key
+
+    def get_next_link(self):
+        return self.encode_cursor(self.page[-1], "n") if self.has_next else None
+
+    def get_previous_link(self):
+        return self.encode_cursor(self.page[0], "p") if self.has_previous else None
+
+    # -----------------------------
+    # Seeking
+    # -----------------------------
+    def seek(self, key, forward):
+        """Rows strictly after (forward) or before `key` in listing order."""
+        condition = Q()
+        for i, name in enumerate(self.ordering):
+            lookup = "lt" if name.startswith("-") == forward else "gt"
+            equal = dict(zip(self.fields[:i], key[:i]))
+            condition |= Q(**equal, **{f"{self.fields[i]}__{lookup}": key[i]})
+        return condition
+
+    def reversed_ordering(self):
+        return [name[1:] if name.startswith("-") else f"-{name}" for name in self.ordering]
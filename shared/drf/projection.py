@@ -0,0 +1,136 @@
+# shared/drf/projection.py
+"""
+Sparse fieldsets for the read endpoints: ?fields=id,title keeps only the
+listed fields, ?exclude=author drops the listed ones. Unknown names are
+a 400 listing them.
+
+DynamicFieldsMixin gives a serializer `fields=` and `exclude=` keyword
+arguments. ProjectionMixin reads both parameters on GET/HEAD, passes them
+to get_serializer() and narrows the queryset to the columns the
+remaining fields read (.only()), so a client asking for ids and titles
+does not pay for the other columns. Views can call wants() to skip
+joins, annotations and prefetches nobody asked for.
+"""
+from functools import lru_cache
+
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+FIELDS_PARAM = "fields"
+EXCLUDE_PARAM = "exclude"
+
+
+def parse_field_list(value):
+    """Sorted, de-duplicated names from "a, b,a"; None when `value` is None."""
+    if value is None:
+        return None
+    return tuple(sorted({name.strip() for name in value.split(",") if name.strip()}))
+
+
+def check_field_names(known, fields, exclude):
+    """Raise a ValidationError naming any of `fields`/`exclude` not in `known`."""
+    errors = {}
+    for param, names in ((FIELDS_PARAM, fields or ()), (EXCLUDE_PARAM, exclude)):
+        unknown = [name for name in names if name not in known]
+        if unknown:
+            errors[param] = [f"Unknown field(s): {', '.join(unknown)}."]
+    if errors:
+        raise serializers.ValidationError(errors)
+
+
+@lru_cache(maxsize=64)
+def field_names(serializer_class):
+    return frozenset(serializer_class().fields)
+
+
+class DynamicFieldsMixin:
+    def __init__(self, *args, fields=None, exclude=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        check_field_names(self.fields, fields, exclude)
+        for name in list(self.fields):
+            if (fields is not None and name not in fields) or name in exclude:
+                self.fields.pop(name)
+
+
+def projected_columns(serializer):
+    """
+    Model fields the serializer's fields read, or None when that cannot be
+    told (method fields, nested serializers, dotted sources, annotations).
+    """
+    opts = serializer.Meta.model._meta
+    columns = {opts.pk.name}
+    for field in serializer.fields.values():
+        if field.write_only:
+            continue
+        if isinstance(field, (serializers.SerializerMethodField, serializers.BaseSerializer)):
+            return None
+        if "." in field.source or field.source == "*":
+            return None
+        try:
+            model_field = opts.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+        if not model_field.concrete:
+            return None
+        columns.add(model_field.name)
+    return columns
+
+
+def ordering_columns(queryset):
+    """Names of the model's own fields `queryset` is ordered by."""
+    opts = queryset.model._meta
+    columns = []
+    for name in queryset.query.order_by:
+        if not isinstance(name, str):
+            continue
+        try:
+            field = opts.get_field(name.lstrip("-"))
+        except FieldDoesNotExist:  # "pk", lookups through relations
+            continue
+        if field.concrete:
+            columns.append(field.name)
+    return columns
+
+
+class ProjectionMixin:
+    """View mixin; put it before the DRF generic view in the bases."""
+
+    def get_projection(self):
+        """
+        (fields or None, exclude) for this request; both hashable. Raises a
+        ValidationError (400) for names the serializer does not have.
+        """
+        if self.request is None or self.request.method not in SAFE_METHODS:
+            return None, ()
+        params = self.request.query_params
+        fields = parse_field_list(params.get(FIELDS_PARAM))
+        exclude = parse_field_list(params.get(EXCLUDE_PARAM)) or ()
+        check_field_names(field_names(self.get_serializer_class()), fields, exclude)
+        return fields, exclude
+
+    def wants(self, name):
+        fields, exclude = self.get_projection()
+        return (fields is None or name in fields) and name not in exclude
+
+    def get_serializer(self, *args, **kwargs):
+        fields, exclude = self.get_projection()
+        if fields is not None or exclude:
+            kwargs.setdefault("fields", fields)
+            kwargs.setdefault("exclude", exclude)
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        # After filtering, so the ordering columns (which the cursor
+        # paginator reads back from the last row) are known and kept
+        queryset = super().filter_queryset(queryset)
+        fields, exclude = self.get_projection()
+        if fields is None and not exclude:
+            return queryset
+        columns = projected_columns(self.get_serializer())
+        if columns is None:
+            return queryset
+        columns.update(ordering_columns(queryset))
+        # Every remaining field is a column of this model, so no related
+        # rows are read
+        return queryset.select_related(None).prefetch_related(None).only(*columns)
@@ -0,0 +1,47 @@
+# shared/drf/streaming.py
+"""
+Opt-in streaming for list endpoints: ?stream=ndjson or ?stream=json.
+
+Rows are read with QuerySet.iterator() and serialized one at a time, so
+exporting the whole table uses constant memory however large it is.
+Filtering, searching and ordering apply as usual; pagination does not.
+"""
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+STREAM_CHUNK_SIZE = 2000
+STREAM_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+class StreamingListMixin:
+    stream_query_param = "stream"
+
+    def list(self, request, *args, **kwargs):
+        mode = request.query_params.get(self.stream_query_param)
+        if mode not in STREAM_CONTENT_TYPES:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        rows = self.stream_rows(queryset)
+        body = self.ndjson_body(rows) if mode == "ndjson" else self.json_body(rows)
+        return StreamingHttpResponse(body, content_type=STREAM_CONTENT_TYPES[mode])
+
+    def stream_rows(self, queryset):
+        encoder = DjangoJSONEncoder(separators=(",", ":"))
+        for instance in queryset.iterator(chunk_size=STREAM_CHUNK_SIZE):
+            yield encoder.encode(self.get_serializer(instance).data)
+
+    @staticmethod
+    def ndjson_body(rows):
+        for row in rows:
+            yield row + "\n"
+
+    @staticmethod
+    def json_body(rows):
+        yield "["
+        for i, row in enumerate(rows):
+            yield row if i == 0 else "," + row
+        yield "]"
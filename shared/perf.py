@@ -0,0 +1,202 @@
+"""
+Per-request performance instrumentation.
+
+PerfMiddleware records, for every request: the number of SQL queries,
+how many of them repeated SQL already run in the same request (the N+1
+signature), time spent in the database, template render time and total
+time. Template time covers every Template.render() call (render(),
+render_to_string(), TemplateResponse), counting nested includes once.
+Samples are kept per view in fixed-size ring buffers, so memory use is
+bounded no matter how long the process lives.
+
+perf_view serves per-view percentiles and latency histograms as JSON
+(mounted at /__perf__). It is open when DEBUG is on and staff-only
+otherwise.
+
+Every project in this repository uses this one module:
+
+  MIDDLEWARE = ["shared.perf.PerfMiddleware", ...]
+  path("__perf__", perf_view, name="perf")   # from shared.perf
+
+Settings: PERF_RING_SIZE - samples kept per view (default 500).
+"""
+import threading
+import time
+from collections import Counter, deque
+from contextlib import ExitStack
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponseForbidden, JsonResponse
+from django.template.base import Template
+
+# Upper bounds (ms) of the total-time histogram buckets; the last is open
+HISTOGRAM_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+METRICS = ("total_ms", "db_ms", "template_ms", "queries", "duplicate_queries")
+
+
+class QueryRecorder:
+    """Database execute wrapper counting queries, their time and their shapes."""
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+            # SQL still has its placeholders, so equal strings = same query shape
+            self.shapes[sql] += 1
+
+    @property
+    def duplicates(self):
+        return sum(n - 1 for n in self.shapes.values() if n > 1)
+
+    def worst_duplicate(self):
+        if not self.shapes:
+            return None
+        sql, n = self.shapes.most_common(1)[0]
+        return (sql, n) if n > 1 else None
+
+
+class PerfStore:
+    """Ring buffer of samples per view; safe to share between threads."""
+
+    def __init__(self, size):
+        self.size = size
+        self.samples = {}
+        self.lock = threading.Lock()
+
+    def add(self, view, sample):
+        with self.lock:
+            ring = self.samples.get(view)
+            if ring is None:
+                ring = self.samples[view] = deque(maxlen=self.size)
+            ring.append(sample)
+
+    def clear(self):
+        with self.lock:
+            self.samples.clear()
+
+    def snapshot(self):
+        with self.lock:
+            samples = {view: list(ring) for view, ring in self.samples.items()}
+        return {view: summarize(rows) for view, rows in sorted(samples.items())}
+
+
+def percentile(sorted_values, pct):
+    index = max(0, int(round(pct / 100 * len(sorted_values))) - 1)
+    return sorted_values[index]
+
+
+def summarize(rows):
+    summary = {"samples": len(rows)}
+    for metric in METRICS:
+        values = sorted(row[metric] for row in rows)
+        summary[metric] = {
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+            "max": values[-1],
+            "mean": round(sum(values) / len(values), 3),
+        }
+    histogram = Counter()
+    for row in rows:
+        bucket = next(
+            (f"<={b}" for b in HISTOGRAM_BUCKETS_MS if row["total_ms"] <= b),
+            f">{HISTOGRAM_BUCKETS_MS[-1]}",
+        )
+        histogram[bucket] += 1
+    summary["total_ms_histogram"] = dict(histogram)
+    suspects = Counter(row["n_plus_one"] for row in rows if row["n_plus_one"])
+    summary["n_plus_one_suspects"] = [
+        {"sql": sql, "requests": n} for sql, n in suspects.most_common(5)
+    ]
+    return summary
+
+
+store = PerfStore(getattr(settings, "PERF_RING_SIZE", 500))
+
+
+class RenderTimer:
+    def __init__(self):
+        self.seconds = 0.0
+        self.depth = 0
+
+
+# The timer of the request being served in this thread/task, if any
+render_timer = ContextVar("perf_render_timer", default=None)
+template_render = Template.render
+
+
+def timed_render(self, context):
+    timer = render_timer.get()
+    if timer is None:
+        return template_render(self, context)
+    timer.depth += 1
+    start = time.perf_counter()
+    try:
+        return template_render(self, context)
+    finally:
+        timer.depth -= 1
+        if not timer.depth:  # {% include %}s are inside their parent's time
+            timer.seconds += time.perf_counter() - start
+
+
+def install_render_timer():
+    """Route Template.render through timed_render; idempotent."""
+    Template.render = timed_render
+
+
+class PerfMiddleware:
+    """Put this first in MIDDLEWARE so the timings cover the whole stack."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        # Only processes that run the middleware have their templates timed
+        install_render_timer()
+
+    def __call__(self, request):
+        recorder = QueryRecorder()
+        timer = RenderTimer()
+        token = render_timer.set(timer)
+        start = time.perf_counter()
+        try:
+            with ExitStack() as stack:
+                for connection in connections.all():
+                    stack.enter_context(connection.execute_wrapper(recorder))
+                response = self.get_response(request)
+        finally:
+            render_timer.reset(token)
+        total = time.perf_counter() - start
+
+        match = getattr(request, "resolver_match", None)
+        if match is not None and match.func is not perf_view:
+            worst = recorder.worst_duplicate()
+            store.add(match.view_name, {
+                "total_ms": round(total * 1000, 3),
+                "db_ms": round(recorder.seconds * 1000, 3),
+                "template_ms": round(timer.seconds * 1000, 3),
+                "queries": recorder.count,
+                "duplicate_queries": recorder.duplicates,
+                "n_plus_one": worst[0][:300] if worst else None,
+            })
+        response["Server-Timing"] = (
+            f"db;dur={recorder.seconds * 1000:.1f}, "
+            f"tpl;dur={timer.seconds * 1000:.1f}, "
+            f"total;dur={total * 1000:.1f}"
+        )
+        return response
+
+
+def perf_view(request):
+    user = getattr(request, "user", None)
+    if not (settings.DEBUG or (user is not None and user.is_staff)):
+        return HttpResponseForbidden("Staff only.")
+    return JsonResponse({"ring_size": store.size, "views": store.snapshot()})